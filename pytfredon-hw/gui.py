@@ -2,27 +2,61 @@
 """Wayland-friendly PySide6 GUI for pytfredon-hw."""
 from __future__ import annotations
 
+import atexit
+import logging
+import signal
 import sys
+import threading
+import time
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from types import MappingProxyType
 from typing import Optional
 
 import psutil
+import shiboken6
 
 from PySide6.QtCore import (
     QCoreApplication,
     QEasingCurve,
-    QPoint,
+    QEvent,
+    QMetaObject,
+    QObject,
+    QPointF,
     QPropertyAnimation,
     QRect,
+    QRectF,
+    QRunnable,
     QSize,
+    QThread,
+    QThreadPool,
     QTimer,
     Qt,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import (
+    QGuiApplication,
+    QCursor,
+    QColor,
+    QImage,
+    QPainter,
+    QPen,
+    QPixmap,
+    QPixmapCache,
+    QPainterPath,
+    QPolygonF,
 )
-from PySide6.QtGui import QGuiApplication, QCursor, QColor, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
+    QGraphicsBlurEffect,
     QGraphicsDropShadowEffect,
     QGraphicsOpacityEffect,
+    QGraphicsPathItem,
+    QGraphicsScene,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -30,9 +64,10 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QVBoxLayout,
     QWidget,
-    QToolTip,
 )
 
+_log = logging.getLogger(__name__)
+
 # --- Design System ---
 
 # DESIGN TOKENS - Comprehensive design system based on Carbon Design System principles
@@ -79,62 +114,151 @@ TYPOGRAPHY = {
 class ShadowManager:
     """Qt-native shadow effects manager - replaces CSS box-shadow."""
 
+    # Shadow configurations based on design system: (blur, dx, dy)
+    SHADOW_CONFIGS = {
+        "none": (0, 0, 0),
+        "01": (3, 0, 1),
+        "02": (6, 0, 4),
+        "03": (15, 0, 10),
+        "04": (25, 0, 20),
+        "05": (50, 0, 25),
+        "hover": (12, 0, 4),
+        "focus": (0, 0, 0),  # Focus uses border, not shadow
+        "active": (2, 0, 1),
+    }
+    DEFAULT_COLOR = QColor(0, 0, 0, 25)  # rgba(0,0,0,0.1)
+    HOVER_COLOR = QColor(102, 163, 255, 38)  # Blue hover shadow
+    FOCUS_COLOR = QColor(102, 163, 255, 128)  # Blue focus shadow
+    # Nine-patch sprites keyed by (level, rgba, corner radius)
+    _PIXMAP_CACHE: dict[tuple, QPixmap] = {}
+
+    @staticmethod
+    def config(level: str) -> tuple[int, int, int]:
+        """(blur, dx, dy) for a level; unknown levels fall back to "01"."""
+        config = ShadowManager.SHADOW_CONFIGS.get(level)
+        return config if config is not None else ShadowManager.SHADOW_CONFIGS["01"]
+
+    @staticmethod
+    def style_shadow(
+        shadow: QGraphicsDropShadowEffect,
+        level: str = "01",
+        color: Optional[QColor] = None,
+    ) -> QGraphicsDropShadowEffect:
+        """Configure an existing drop shadow for a design system level."""
+        blur, dx, dy = ShadowManager.config(level)
+        # The setters are no-ops when the value is unchanged
+        shadow.setBlurRadius(blur)
+        shadow.setOffset(dx, dy)
+        shadow.setColor(color or ShadowManager.DEFAULT_COLOR)
+        return shadow
+
     @staticmethod
     def create_shadow(
         level: str = "01", color: Optional[QColor] = None
     ) -> QGraphicsDropShadowEffect:
         """Create a drop shadow effect based on design system levels."""
-        shadow = QGraphicsDropShadowEffect()
-
-        # Shadow configurations based on design system
-        shadow_configs = {
-            "none": {"blur": 0, "offset": (0, 0)},
-            "01": {"blur": 3, "offset": (0, 1)},
-            "02": {"blur": 6, "offset": (0, 4)},
-            "03": {"blur": 15, "offset": (0, 10)},
-            "04": {"blur": 25, "offset": (0, 20)},
-            "05": {"blur": 50, "offset": (0, 25)},
-            "hover": {"blur": 12, "offset": (0, 4)},
-            "focus": {"blur": 0, "offset": (0, 0)},  # Focus uses border, not shadow
-            "active": {"blur": 2, "offset": (0, 1)},
-        }
-
-        config = shadow_configs.get(level, shadow_configs["01"])
-        shadow.setBlurRadius(config["blur"])
-        shadow.setOffset(*config["offset"])
-
-        # Set shadow color
-        if color:
-            shadow.setColor(color)
-        else:
-            # Default shadow color from design system
-            shadow.setColor(QColor(0, 0, 0, 25))  # rgba(0,0,0,0.1)
-
-        return shadow
+        return ShadowManager.style_shadow(QGraphicsDropShadowEffect(), level, color)
 
     @staticmethod
     def apply_shadow(
-        widget: QWidget, level: str = "01", color: Optional[QColor] = None
+        widget: QWidget,
+        level: str = "01",
+        color: Optional[QColor] = None,
     ):
-        """Apply shadow effect to a widget."""
-        if level == "none":
+        """Apply shadow effect to a widget, reusing its current shadow if any."""
+        previous = getattr(widget, "shadow_spec", None)
+        spec = widget.shadow_spec = (level, color)
+        current_effect = widget.graphicsEffect()
+        parent = widget.parentWidget()
+        if isinstance(parent, ContainerShadowFrame):
+            # The container paints the shadow; drop any live blur on the child
+            if isinstance(current_effect, QGraphicsDropShadowEffect):
+                widget.setGraphicsEffect(None)  # type: ignore
+            if previous is None:
+                widget.installEventFilter(parent)
+            if spec != previous:
+                parent.update()
+        elif level == "none":
             # Remove existing graphics effect
-            current_effect = widget.graphicsEffect()
             if current_effect:
                 current_effect.setParent(None)
             widget.setGraphicsEffect(None)  # type: ignore
+        elif isinstance(current_effect, QGraphicsDropShadowEffect):
+            if spec != previous:
+                ShadowManager.style_shadow(current_effect, level, color)
         else:
             shadow = ShadowManager.create_shadow(level, color)
             widget.setGraphicsEffect(shadow)
 
+    @staticmethod
+    def shadow_pixmap(
+        level: str = "01", color: Optional[QColor] = None, radius: int = 0
+    ) -> QPixmap:
+        """Nine-patch shadow sprite: blur + radius px corners around a 1px band."""
+        color = color or ShadowManager.DEFAULT_COLOR
+        key = (level, color.rgba(), radius)
+        pix = ShadowManager._PIXMAP_CACHE.get(key)
+        if pix is None:
+            blur = ShadowManager.config(level)[0]
+            side = 2 * (blur + radius) + 1
+            # Blur a rounded rect once through a throwaway scene; the same
+            # gaussian QGraphicsDropShadowEffect would run on every repaint
+            shape = QPainterPath()
+            shape.addRoundedRect(
+                QRectF(blur, blur, 2 * radius + 1, 2 * radius + 1), radius, radius
+            )
+            item = QGraphicsPathItem(shape)
+            item.setPen(Qt.PenStyle.NoPen)
+            item.setBrush(color)
+            if blur:
+                effect = QGraphicsBlurEffect()
+                effect.setBlurRadius(blur)
+                effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+                item.setGraphicsEffect(effect)
+            scene = QGraphicsScene()
+            scene.addItem(item)
+            pix = QPixmap(side, side)
+            pix.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pix)
+            bounds = QRectF(0, 0, side, side)
+            scene.render(painter, bounds, bounds)
+            painter.end()
+            ShadowManager._PIXMAP_CACHE[key] = pix
+        return pix
+
+    @staticmethod
+    def draw_shadow(
+        painter: QPainter,
+        rect: QRect,
+        level: str = "01",
+        color: Optional[QColor] = None,
+        radius: int = 0,
+    ):
+        """Blit the cached nine-patch shadow for `level` behind `rect`."""
+        if level == "none":
+            return
+        blur, dx, dy = ShadowManager.config(level)
+        pix = ShadowManager.shadow_pixmap(level, color, radius)
+        target = rect.translated(dx, dy).adjusted(-blur, -blur, blur, blur)
+        corner = blur + radius
+        fit = min(corner, target.width() // 2, target.height() // 2)
+        src = (0, corner, corner + 1, 2 * corner + 1)
+        xs = (target.left(), target.left() + fit, target.right() + 1 - fit)
+        xs += (target.right() + 1,)
+        ys = (target.top(), target.top() + fit, target.bottom() + 1 - fit)
+        ys += (target.bottom() + 1,)
+        for i in range(3):
+            for j in range(3):
+                painter.drawPixmap(
+                    QRect(xs[i], ys[j], xs[i + 1] - xs[i], ys[j + 1] - ys[j]),
+                    pix,
+                    QRect(src[i], src[j], src[i + 1] - src[i], src[j + 1] - src[j]),
+                )
+
     @staticmethod
     def create_hover_shadow() -> QGraphicsDropShadowEffect:
         """Create special hover shadow with blue tint."""
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(12)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(102, 163, 255, 38))  # Blue hover shadow
-        return shadow
+        return ShadowManager.create_shadow("hover", ShadowManager.HOVER_COLOR)
 
     @staticmethod
     def create_focus_shadow() -> QGraphicsDropShadowEffect:
@@ -142,7 +266,7 @@ class ShadowManager:
         shadow = QGraphicsDropShadowEffect()
         shadow.setBlurRadius(4)
         shadow.setOffset(0, 0)
-        shadow.setColor(QColor(102, 163, 255, 128))  # Blue focus shadow
+        shadow.setColor(ShadowManager.FOCUS_COLOR)
         return shadow
 
 
@@ -166,6 +290,12 @@ class AnimationManager:
         "elastic": QEasingCurve.Type.OutElastic,
     }
 
+    # Property names pre-encoded for QPropertyAnimation
+    PROPERTIES = {
+        name: name.encode()
+        for name in ("geometry", "opacity", "pos", "size", "windowOpacity")
+    }
+
     @staticmethod
     def create_animation(
         widget: QWidget,
@@ -174,66 +304,142 @@ class AnimationManager:
         easing: str = "standard",
     ) -> QPropertyAnimation:
         """Create a property animation with design system timing."""
-        animation = QPropertyAnimation(widget, property_name.encode())
+        prop = AnimationManager.PROPERTIES.get(property_name)
+        if prop is None:
+            prop = property_name.encode()
+        animation = QPropertyAnimation(widget, prop)
         animation.setDuration(AnimationManager.DURATIONS[duration])
-        animation.setEasingCurve(AnimationManager.EASING[easing])
+        animation.setEasingCurve(AnimationManager.EASING_CURVES[easing])
         return animation
 
     @staticmethod
     def animate_hover_scale(widget: QWidget, scale_factor: float = 1.02):
-        """Animate widget scale on hover."""
-        animation = AnimationManager.create_animation(widget, "geometry", "fast")
+        """Animate widget scale on hover; skipped while nothing of it is on screen."""
+        if not widget.isVisible() or widget.visibleRegion().isEmpty():
+            return None
         current_geometry = widget.geometry()
 
-        # Calculate scaled geometry
-        center_x = current_geometry.x() + current_geometry.width() / 2
-        center_y = current_geometry.y() + current_geometry.height() / 2
-        new_width = int(current_geometry.width() * scale_factor)
-        new_height = int(current_geometry.height() * scale_factor)
-        new_x = int(center_x - new_width / 2)
-        new_y = int(center_y - new_height / 2)
+        # The resting geometry rarely changes between hovers; reuse its target
+        cached = getattr(widget, "_hover_geometry", None)
+        if cached is not None and cached[:2] == (current_geometry, scale_factor):
+            scaled_geometry = cached[2]
+        else:
+            # Calculate scaled geometry
+            center_x = current_geometry.x() + current_geometry.width() / 2
+            center_y = current_geometry.y() + current_geometry.height() / 2
+            new_width = int(current_geometry.width() * scale_factor)
+            new_height = int(current_geometry.height() * scale_factor)
+            new_x = int(center_x - new_width / 2)
+            new_y = int(center_y - new_height / 2)
+            scaled_geometry = QRect(new_x, new_y, new_width, new_height)
+            widget._hover_geometry = (current_geometry, scale_factor, scaled_geometry)
+
+        return AnimationManager.animate_geometry(widget, scaled_geometry)
 
-        from PySide6.QtCore import QRect
+    @staticmethod
+    def animate_geometry(widget: QWidget, target: QRect, duration: str = "fast"):
+        """Run the widget's single geometry animation from where it is to target."""
+        animation = getattr(widget, "_geometry_anim", None)
+        if animation is None:
+            animation = AnimationManager.create_animation(widget, "geometry", duration)
+            animation.setParent(widget)
+            widget._geometry_anim = animation
+        animation.stop()
+        animation.setDuration(AnimationManager.DURATIONS[duration])
+        animation.setStartValue(widget.geometry())
+        animation.setEndValue(target)
+        animation.start()
+        return animation
 
-        scaled_geometry = QRect(new_x, new_y, new_width, new_height)
+    @staticmethod
+    def _opacity_animation(widget: QWidget) -> QPropertyAnimation:
+        """The widget's single opacity animation, created on first use.
 
-        animation.setStartValue(current_geometry)
-        animation.setEndValue(scaled_geometry)
-        animation.start()
+        Reused while the widget keeps the same QGraphicsOpacityEffect; the
+        animation is parented to the widget so it cannot be collected mid-run.
+        """
+        effect = widget.graphicsEffect()
+        animation = getattr(widget, "_opacity_anim", None)
+        if (
+            not isinstance(effect, QGraphicsOpacityEffect)
+            or animation is None
+            or animation.targetObject() is not effect
+        ):
+            if not isinstance(effect, QGraphicsOpacityEffect):
+                effect = QGraphicsOpacityEffect(widget)
+                widget.setGraphicsEffect(effect)
+            animation = QPropertyAnimation(effect, b"opacity", widget)
+            animation.setEasingCurve(AnimationManager.EASING_CURVES["standard"])
+            animation.finished.connect(
+                partial(AnimationManager._release_opacity, widget, animation)
+            )
+            widget._opacity_anim = animation
         return animation
 
+    @staticmethod
+    def _release_opacity(widget: QWidget, animation: QPropertyAnimation):
+        """Drop an opacity effect that ended fully opaque, e.g. after a pulse.
+
+        An effect at 1.0 changes nothing on screen but still makes Qt render
+        the widget offscreen on every repaint.
+        """
+        effect = animation.targetObject()
+        if effect is None or widget.graphicsEffect() is not effect:
+            return
+        if effect.opacity() >= 1.0:
+            widget._opacity_anim = None
+            animation.deleteLater()
+            widget.setGraphicsEffect(None)  # type: ignore
+
     @staticmethod
     def animate_opacity(
         widget: QWidget, target_opacity: float, duration: str = "moderate"
     ):
         """Animate widget opacity."""
-        # Check if widget already has an opacity effect
-        effect = widget.graphicsEffect()
-        if not isinstance(effect, QGraphicsOpacityEffect):
-            effect = QGraphicsOpacityEffect()
-            widget.setGraphicsEffect(effect)
-
-        animation = QPropertyAnimation(effect, b"opacity")
+        animation = AnimationManager._opacity_animation(widget)
+        animation.stop()
         animation.setDuration(AnimationManager.DURATIONS[duration])
-        animation.setEasingCurve(AnimationManager.EASING["standard"])
+        # Plain start -> end run; drops keyframes a pulse may have left behind
+        animation.setKeyValues([])
+        animation.setStartValue(animation.targetObject().opacity())
         animation.setEndValue(target_opacity)
         animation.start()
         return animation
 
+    @staticmethod
+    def animate_opacity_pulse(
+        widget: QWidget, down: float = 0.7, duration: str = "moderate"
+    ):
+        """Dip widget opacity to `down` and back in one keyframed animation."""
+        animation = AnimationManager._opacity_animation(widget)
+        animation.stop()
+        animation.setDuration(AnimationManager.DURATIONS[duration])
+        animation.setKeyValueAt(0.0, 1.0)
+        animation.setKeyValueAt(0.5, down)
+        animation.setKeyValueAt(1.0, 1.0)
+        animation.start()
+        return animation
 
-class InteractionManager:
+
+class InteractionManager(QObject):
     """Manages micro-interactions and hover/focus effects."""
 
     def __init__(self, widget: QWidget):
+        super().__init__(widget)
         self.widget = widget
-        self.hover_animation = None
         self.scale_animation = None
-        self.original_shadow = None
-        self.hover_shadow = None
 
         # Store original geometry for scale animations
         self.original_geometry = None
 
+        # Enter/leave storms settle into one state change per frame
+        self._hover_state: Optional[str] = None
+        self._pending_state: Optional[str] = None
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(16)
+        self._debounce_timer.timeout.connect(self._apply_pending_state)
+
     def setup_hover_effects(
         self, enable_scale: bool = True, enable_shadow: bool = True
     ):
@@ -245,16 +451,36 @@ class InteractionManager:
         if enable_shadow:
             ShadowManager.apply_shadow(self.widget, "01")
 
-        # Install event filter or override events in widget
-        self.widget.enterEvent = self._on_enter
-        self.widget.leaveEvent = self._on_leave
+        # Filter rather than override, so the widget's own handlers still run
+        self.widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.Type.Enter:
+            self._pending_state = "in"
+            self._debounce_timer.start()
+        elif event_type == QEvent.Type.Leave:
+            self._pending_state = "out"
+            self._debounce_timer.start()
+        return False
+
+    def _apply_pending_state(self):
+        state = self._pending_state
+        if state == self._hover_state:
+            return  # Entered and left again within the frame
+        self._hover_state = state
+        if state == "in":
+            self._on_enter()
+        else:
+            self._on_leave()
 
-    def _on_enter(self, event):
+    def _on_enter(self):
         """Handle mouse enter event."""
-        # Apply hover shadow - create new effect each time
+        if not self.widget.isVisible():
+            return  # Hidden by the time the debounced enter is applied
+        # Apply hover shadow, restyling the current effect in place
         if self.enable_shadow:
-            hover_shadow = ShadowManager.create_hover_shadow()
-            self.widget.setGraphicsEffect(hover_shadow)
+            ShadowManager.apply_shadow(self.widget, "hover", ShadowManager.HOVER_COLOR)
 
         # Animate scale
         if self.enable_scale:
@@ -264,22 +490,17 @@ class InteractionManager:
                 self.widget, 1.02
             )
 
-    def _on_leave(self, event):
+    def _on_leave(self):
         """Handle mouse leave event."""
-        # Restore original shadow - create new effect each time
+        # Restore original shadow
         if self.enable_shadow:
-            original_shadow = ShadowManager.create_shadow("01")
-            self.widget.setGraphicsEffect(original_shadow)
+            ShadowManager.apply_shadow(self.widget, "01")
 
         # Animate back to original scale
         if self.enable_scale and self.original_geometry and self.scale_animation:
-            animation = AnimationManager.create_animation(
-                self.widget, "geometry", "fast"
+            self.scale_animation = AnimationManager.animate_geometry(
+                self.widget, self.original_geometry
             )
-            animation.setStartValue(self.widget.geometry())
-            animation.setEndValue(self.original_geometry)
-            animation.start()
-            self.scale_animation = animation
 
 
 # 2. COLOR SYSTEM
@@ -371,6 +592,20 @@ COLORS = {
     "action_danger": "#ef4444",
 }
 
+# Sparkline colors, parsed once instead of on every redraw
+_INTERACTIVE_COLOR = QColor(COLORS["interactive-01"])
+_INTERACTIVE_FILL = QColor(COLORS["interactive-01"])
+_INTERACTIVE_FILL.setAlpha(30)  # 30% opacity
+_INTERACTIVE_GLOW = QColor(COLORS["interactive-01"])
+_INTERACTIVE_GLOW.setAlpha(20)
+# Sparkline pens; QPen is implicitly shared, so render jobs can use them
+_SPARK_PEN = QPen(_INTERACTIVE_COLOR)
+_SPARK_PEN.setWidth(3)  # Slightly thicker line for better visibility
+_SPARK_PEN.setCapStyle(Qt.PenCapStyle.RoundCap)
+_SPARK_PEN.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+_SPARK_GLOW_PEN = QPen(_INTERACTIVE_GLOW)
+_SPARK_GLOW_PEN.setWidth(5)
+
 # 3. SPACING SYSTEM
 # Refined 4px/8px base unit system with consistent application
 # Following 8-point grid system for precise alignment
@@ -447,24 +682,271 @@ ANIMATION = {
     "easing-accelerated": "cubic-bezier(0.4, 0.0, 1, 1)",  # AnimationManager.EASING["accelerate"]
 }
 
+
+def _frozen(tokens: dict) -> MappingProxyType:
+    """Read-only view of a token table with interned keys."""
+    return MappingProxyType({sys.intern(k): v for k, v in tokens.items()})
+
+
+# Design tokens are read-only from here on
+TYPOGRAPHY = _frozen(TYPOGRAPHY)
+COLORS = _frozen(COLORS)
+SPACING = _frozen(SPACING)
+RADIUS = _frozen(RADIUS)
+ELEVATION = _frozen(ELEVATION)
+ANIMATION = _frozen(ANIMATION)
+ShadowManager.SHADOW_CONFIGS = _frozen(ShadowManager.SHADOW_CONFIGS)
+AnimationManager.DURATIONS = _frozen(AnimationManager.DURATIONS)
+AnimationManager.EASING = _frozen(AnimationManager.EASING)
+AnimationManager.PROPERTIES = _frozen(AnimationManager.PROPERTIES)
+# Built once; setEasingCurve copies the curve, so instances can be shared
+AnimationManager.EASING_CURVES = _frozen(
+    {name: QEasingCurve(t) for name, t in AnimationManager.EASING.items()}
+)
+
+
+def _precompute_styles() -> dict[str, str]:
+    """Materialise the design-system stylesheets once, at import time."""
+    styles = {
+        "popup": f"""
+        #hwpopup {{
+            background-color: {COLORS['background']};
+            color: {COLORS['text-primary']};
+            border-radius: {RADIUS['modal']}px;
+            border: 1px solid {COLORS['border-subtle']};
+            /* Shadows now handled by ShadowManager */
+        }}
+
+        QLabel {{
+            color: {COLORS['text-primary']};
+            {TYPOGRAPHY['body-01']}
+        }}
+
+        QPushButton {{
+            background-color: {COLORS['button-secondary']};
+            color: {COLORS['text-primary']};
+            border: 1px solid {COLORS['border-subtle']};
+            border-radius: {RADIUS['button']}px;
+            padding: {SPACING['button-padding-sm']};
+            {TYPOGRAPHY['body-compact-01']}
+            /* Transitions now handled by AnimationManager */
+        }}
+
+        QPushButton:hover {{
+            background-color: {COLORS['button-secondary-hover']};
+            border-color: {COLORS['border-strong']};
+        }}
+
+        QPushButton:focus {{
+            outline: 2px solid {COLORS['focus']};
+            outline-offset: 2px;
+        }}
+
+        QPushButton:pressed {{
+            background-color: {COLORS['layer-active']};
+        }}
+
+        /* Close button specific styling */
+        QPushButton#close-button {{
+            background-color: transparent;
+            color: {COLORS['text-tertiary']};
+            border: none;
+            border-radius: {RADIUS['md']}px;
+            font-size: 16px;
+            font-weight: 600;
+            width: 32px;
+            height: 32px;
+        }}
+
+        QPushButton#close-button:hover {{
+            background-color: {COLORS['support-error']};
+            color: {COLORS['text-on-color']};
+        }}
+
+        QPushButton#close-button:focus {{
+            background-color: {COLORS['support-error']};
+            color: {COLORS['text-on-color']};
+            outline: 2px solid {COLORS['focus']};
+        }}
+
+        /* Loading state overlay */
+        QFrame#loading-overlay {{
+            background-color: rgba(0, 0, 0, 50);
+            border-radius: {RADIUS['modal']}px;
+        }}
+
+        QLabel#loading-spinner {{
+            color: {COLORS['text-primary']};
+            {TYPOGRAPHY['heading-02']}
+        }}
+
+        /* Header */
+        QLabel#app-title {{
+            {TYPOGRAPHY['heading-02']} color: {COLORS['text-primary']};
+        }}
+
+        QLabel#app-subtitle {{
+            {TYPOGRAPHY['body-compact-01']} color: {COLORS['text-secondary']};
+        }}
+
+        /* Details panel */
+        #details {{
+            background-color: {COLORS['layer-02']};
+            border: 1px solid {COLORS['border-subtle']};
+            border-radius: {RADIUS['lg']}px;
+            {ELEVATION['02']}
+        }}
+
+        QLabel#details-title {{
+            {TYPOGRAPHY['heading-03']} color: {COLORS['text-primary']};
+        }}
+
+        QLabel#details-body {{
+            {TYPOGRAPHY['body-01']} color: {COLORS['text-secondary']}; line-height: 1.5;
+        }}
+
+        /* Footer */
+        QLabel[role="footer"] {{
+            {TYPOGRAPHY['body-02']} color: {COLORS['text-tertiary']};
+        }}
+
+        /* Metric cards */
+        QFrame[objectName^="card_"] {{
+            background-color: {COLORS['layer-01']};
+            border: 1px solid {COLORS['border-subtle']};
+            border-radius: {RADIUS['card']}px;
+            padding: {SPACING['card-padding']};
+            /* Shadows now handled by ShadowManager */
+            /* Transitions now handled by AnimationManager and InteractionManager */
+        }}
+
+        QFrame[objectName^="card_"]:hover {{
+            background-color: {COLORS['layer-hover']};
+            border-color: {COLORS['border-interactive']};
+            /* Hover animations now handled by InteractionManager */
+        }}
+
+        QFrame[objectName^="card_"]:focus {{
+            outline: 2px solid {COLORS['focus']};
+            outline-offset: 2px;
+            border-color: {COLORS['border-interactive']};
+        }}
+
+        QFrame[objectName^="card_"][pressed="true"] {{
+            background-color: {COLORS['layer-active']};
+        }}
+
+        QFrame[objectName^="card_"][selected="true"] {{
+            background-color: {COLORS['layer-selected']};
+            border-color: {COLORS['interactive-01']};
+        }}
+
+        /* Loading state styling */
+        QFrame[objectName^="card_"][loading="true"] {{
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 {COLORS['layer-01']},
+                stop:0.5 {COLORS['layer-hover']},
+                stop:1 {COLORS['layer-01']});
+        }}
+
+        QLabel#card-title {{
+            {TYPOGRAPHY['heading-04']} color: {COLORS['text-primary']};
+        }}
+
+        QLabel#card-value {{
+            {TYPOGRAPHY['value']} color: {COLORS['text-secondary']};
+        }}
+        """,
+    }
+    for status, color in (
+        ("normal", COLORS["support-success"]),
+        ("warning", COLORS["support-warning"]),
+        ("error", COLORS["support-error"]),
+        ("info", COLORS["support-info"]),
+    ):
+        styles[f"status-{status}"] = f"background-color: {color}; border-radius: 4px;"
+    return styles
+
+
+STYLES = _frozen(_precompute_styles())
+# Status indicator sheets keyed by bare status for Card.set_status
+STATUS_STYLES = _frozen(
+    {key[7:]: sheet for key, sheet in STYLES.items() if key.startswith("status-")}
+)
+# Details panel margins (top + bottom) plus title/body spacing, in px
+_DETAILS_CHROME = SPACING["xl"] * 2 + SPACING["md"]
+
 # --- Config ---
 UPDATE_INTERVAL_MS = 2000
+PARTITIONS_TTL_S = 30.0  # How long the mount table is reused between polls
+GPU_RETRY_MIN_S = 4.0  # First pause after a failed GPU read
+GPU_RETRY_MAX_S = 60.0  # Longest pause between GPU read attempts
+DISK_USAGE_TIMEOUT_S = 0.2  # Budget for all mounts' statvfs calls per poll
+DISKS_TTL_S = 10.0  # Disk usage moves slowly; re-read it at most this often
 HISTORY_MAX = 30
-HISTORY: dict[str, list[float]] = {"cpu": [], "ram": [], "gpu": [], "disk": []}
+SPARK_WIDTH = 140
+SPARK_HEIGHT = 40
+SPARK_DPR = 2  # HiDPI support
+SPARK_GLOW_MIN_PX = 160  # Device pixels below which the glow pass is skipped
+SPARK_FLAT_TOLERANCE = 0.5  # Percent points treated as "no change" when drawing
+SPARK_CACHE_KB = 1024  # QPixmapCache budget shared by all sparklines
+HISTORY: dict[str, deque[float]] = {
+    k: deque(maxlen=HISTORY_MAX) for k in ("cpu", "ram", "gpu", "disk")
+}
+
+
+# Status bands: a value below bins[i] gets _STATUS_LABELS[i], anything at or
+# above the last bin the final label
+_STATUS_LABELS = ("normal", "warning", "error")
+_STATUS_BINS = (80, 90)
+_GPU_STATUS_BINS = (80, 95)
+
+
+def _status(value: float, bins=_STATUS_BINS) -> str:
+    return _STATUS_LABELS[bisect_right(bins, value)]
+
+
+def _usage_of(metrics: dict) -> dict[str, float]:
+    """Headline percentage per card, keyed like HISTORY.
+
+    The get_*_info helpers always report these percentages as floats.
+    """
+    gpus = metrics["gpus"]
+    disks = metrics["disks"]
+    return {
+        "cpu": metrics["cpu"]["usage"],
+        "ram": metrics["ram"]["percent"],
+        "gpu": gpus[0]["util"] if gpus else 0.0,
+        "disk": disks[0]["percent"] if disks else 0.0,
+    }
 
 
 # --------- Metrics helpers ---------
-def get_cpu_info() -> dict[str, Optional[float]]:
-    usage = psutil.cpu_percent(interval=0.05)
+# CPU temperature sensor chosen on the first poll; None once probed means
+# there is no usable sensor and later polls skip the scan entirely
+_CPU_TEMP_KEY: Optional[str] = None
+_CPU_TEMP_PROBED = False
+
+
+def get_cpu_info(interval: Optional[float] = None) -> dict[str, Optional[float]]:
+    global _CPU_TEMP_KEY, _CPU_TEMP_PROBED
+    usage = float(psutil.cpu_percent(interval=interval))
     temp: Optional[float] = None
+    if _CPU_TEMP_PROBED and _CPU_TEMP_KEY is None:
+        return {"usage": usage, "temp": temp}
     try:
         temps = psutil.sensors_temperatures()
-        for k, v in temps.items():
-            if k.lower() in ("coretemp", "k10temp", "cpu_thermal", "acpi") and v:
-                temp = round(v[0].current, 1)
-                break
+        if not _CPU_TEMP_PROBED:
+            for k, v in temps.items():
+                if k.lower() in ("coretemp", "k10temp", "cpu_thermal", "acpi") and v:
+                    _CPU_TEMP_KEY = k
+                    break
+        entries = temps.get(_CPU_TEMP_KEY)
+        if entries:
+            temp = round(entries[0].current, 1)
     except Exception:
         pass
+    _CPU_TEMP_PROBED = True
     return {"usage": usage, "temp": temp}
 
 
@@ -477,60 +959,185 @@ def get_ram_info() -> dict[str, float]:
     }
 
 
-def get_gpu_info() -> list[dict[str, float | str | None]]:
+# pynvml stays initialised for the life of the process: nvmlInit loads the
+# driver and walks the device tree, far too slow to repeat on every poll
+_NVML = None
+_NVML_DEVICES: list[tuple[object, str]] = []  # (handle, name)
+_NVML_FAILED = False
+
+
+def _nvml():
+    """Return the initialised pynvml module, or None without NVIDIA support."""
+    global _NVML, _NVML_FAILED
+    if _NVML is None and not _NVML_FAILED:
+        try:
+            import pynvml as nvml  # type: ignore
+
+            nvml.nvmlInit()
+        except Exception:
+            _NVML_FAILED = True
+            return None
+        try:
+            for i in range(nvml.nvmlDeviceGetCount()):
+                h = nvml.nvmlDeviceGetHandleByIndex(i)
+                name = nvml.nvmlDeviceGetName(h)
+                if isinstance(name, bytes):
+                    name = name.decode()
+                _NVML_DEVICES.append((h, str(name)))
+        except Exception:
+            _NVML_DEVICES.clear()
+            _NVML_FAILED = True
+            nvml.nvmlShutdown()
+            return None
+        atexit.register(nvml.nvmlShutdown)
+        _NVML = nvml
+    return _NVML
+
+
+# pyamdgpuinfo's (detect, name, load, temp) callables, resolved on first use
+# with fallbacks for any the installed version lacks. Python does not cache
+# failed imports, so without the flag every poll would search again
+_AMDGPU: Optional[tuple] = None
+_AMDGPU_FAILED = False
+
+# Polls are suspended until this time after a GPU read fails; the pause
+# doubles on each consecutive failure (GPU_RETRY_MIN_S..GPU_RETRY_MAX_S)
+_GPU_RETRY_AT = float("-inf")
+_GPU_BACKOFF_S = 0.0
+
+
+def _amdgpu() -> Optional[tuple]:
+    """Return pyamdgpuinfo's bound callables, or None when it is not installed."""
+    global _AMDGPU, _AMDGPU_FAILED
+    if _AMDGPU is None and not _AMDGPU_FAILED:
+        try:
+            import pyamdgpuinfo as amdgpu  # type: ignore
+        except Exception:
+            _AMDGPU_FAILED = True
+            return None
+        _AMDGPU = (
+            getattr(amdgpu, "detect_gpus", None) or (lambda: 0),
+            getattr(amdgpu, "get_gpu_name", None) or (lambda _i: "AMD GPU"),
+            getattr(amdgpu, "get_gpu_load", None) or (lambda _i: 0),
+            getattr(amdgpu, "get_temp", None) or (lambda _i: None),
+        )
+    return _AMDGPU
+
+
+def _nvml_gpus(nvml) -> list[dict[str, float | str | None]]:
     gpus: list[dict[str, float | str | None]] = []
-    try:
-        import pynvml as nvml  # type: ignore
-
-        nvml.nvmlInit()
-        count = nvml.nvmlDeviceGetCount()
-        for i in range(count):
-            h = nvml.nvmlDeviceGetHandleByIndex(i)
-            name = nvml.nvmlDeviceGetName(h)
-            if isinstance(name, bytes):
-                name = name.decode()
-            util = float(nvml.nvmlDeviceGetUtilizationRates(h).gpu)
-            mem = nvml.nvmlDeviceGetMemoryInfo(h)
-            temp: Optional[float] = None
+    for h, name in _NVML_DEVICES:
+        util = float(nvml.nvmlDeviceGetUtilizationRates(h).gpu)
+        mem = nvml.nvmlDeviceGetMemoryInfo(h)
+        temp: Optional[float] = None
+        try:
+            temp = float(nvml.nvmlDeviceGetTemperature(h, nvml.NVML_TEMPERATURE_GPU))
+        except Exception:
+            pass
+        gpus.append(
+            {
+                "name": name,
+                "util": util,
+                "mem_used_gb": round(int(mem.used) / float(1024**3), 2),
+                "mem_total_gb": round(int(mem.total) / float(1024**3), 2),
+                "temp": temp,
+            }
+        )
+    return gpus
+
+
+def _amd_gpus(amdgpu: tuple) -> list[dict[str, float | str | None]]:
+    detect, get_name, get_load, get_temp = amdgpu
+    gpus: list[dict[str, float | str | None]] = []
+    for i in range(int(detect())):
+        temp = get_temp(i)
+        gpus.append(
+            {
+                "name": str(get_name(i)),
+                "util": float(get_load(i)),
+                "temp": float(temp) if temp is not None else None,
+            }
+        )
+    return gpus
+
+
+def get_gpu_info() -> list[dict[str, float | str | None]]:
+    global _GPU_RETRY_AT, _GPU_BACKOFF_S
+    now = time.monotonic()
+    if now < _GPU_RETRY_AT:
+        return []
+    gpus = None
+    nvml = _nvml()
+    if nvml is not None:
+        try:
+            gpus = _nvml_gpus(nvml)
+        except Exception:
+            pass
+    if gpus is None:
+        amdgpu = _amdgpu()
+        if amdgpu is None and nvml is None:
+            return []  # No GPU backend on this machine
+        if amdgpu is not None:
             try:
-                temp = float(
-                    nvml.nvmlDeviceGetTemperature(h, nvml.NVML_TEMPERATURE_GPU)
-                )
+                gpus = _amd_gpus(amdgpu)
             except Exception:
                 pass
-            gpus.append(
-                {
-                    "name": str(name),
-                    "util": util,
-                    "mem_used_gb": round(int(mem.used) / float(1024**3), 2),
-                    "mem_total_gb": round(int(mem.total) / float(1024**3), 2),
-                    "temp": temp,
-                }
-            )
-        nvml.nvmlShutdown()
-        return gpus
-    except Exception:
-        pass
-    try:
-        import pyamdgpuinfo as amdgpu  # type: ignore
-
-        cnt = getattr(amdgpu, "detect_gpus", lambda: 0)()
-        for i in range(int(cnt)):
-            name = getattr(amdgpu, "get_gpu_name", lambda _i: "AMD GPU")(i)
-            util = float(getattr(amdgpu, "get_gpu_load", lambda _i: 0)(i))
-            temp = getattr(amdgpu, "get_temp", lambda _i: None)(i)
-            temp = float(temp) if temp is not None else None
-            gpus.append({"name": str(name), "util": util, "temp": temp})
-    except Exception:
-        pass
+    if gpus is None:
+        _GPU_BACKOFF_S = min(max(_GPU_BACKOFF_S * 2, GPU_RETRY_MIN_S), GPU_RETRY_MAX_S)
+        _GPU_RETRY_AT = now + _GPU_BACKOFF_S
+        return []
+    _GPU_BACKOFF_S = 0.0
     return gpus
 
 
+# Mounted partitions with the time they were listed. Listing reads
+# /proc/filesystems and the mount table; mounts change far less often
+# than every poll, so only the statvfs in disk_usage runs each tick
+_PARTITIONS: tuple[float, list] = (float("-inf"), [])
+
+# statvfs on a stalled network or FUSE mount can block for seconds. Each
+# mount is read on its own thread and left out of a poll that it misses;
+# a read still in flight is waited on again rather than started twice
+_DISK_PENDING: dict[str, Future] = {}
+
+
+def _disk_usage_async(mount: str) -> Future:
+    """Run disk_usage(mount) on a daemon thread.
+
+    Daemon threads, unlike executor workers, are not joined at interpreter
+    exit, so a read stuck on a dead mount cannot keep the app from quitting.
+    """
+    fut: Future = Future()
+
+    def read():
+        try:
+            fut.set_result(psutil.disk_usage(mount))
+        except Exception as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=read, name="statvfs", daemon=True).start()
+    return fut
+
+
 def get_disk_info() -> list[dict[str, float | str]]:
+    global _PARTITIONS
+    listed_at, partitions = _PARTITIONS
+    now = time.monotonic()
+    if now - listed_at > PARTITIONS_TTL_S:
+        partitions = psutil.disk_partitions(all=False)
+        _PARTITIONS = (now, partitions)
+    reads = []
+    for part in partitions:
+        fut = _DISK_PENDING.get(part.mountpoint)
+        if fut is None or fut.done():
+            fut = _disk_usage_async(part.mountpoint)
+            _DISK_PENDING[part.mountpoint] = fut
+        reads.append((part, fut))
+    deadline = now + DISK_USAGE_TIMEOUT_S
     out: list[dict[str, float | str]] = []
-    for part in psutil.disk_partitions(all=False):
+    for part, fut in reads:
         try:
-            usage = psutil.disk_usage(part.mountpoint)
+            usage = fut.result(timeout=max(0.0, deadline - time.monotonic()))
             out.append(
                 {
                     "device": part.device,
@@ -543,10 +1150,296 @@ def get_disk_info() -> list[dict[str, float | str]]:
     return out
 
 
+class MetricsWorker(QObject):
+    """Polls system metrics off the GUI thread and emits one dict per sample."""
+
+    sampled = Signal(dict)
+
+    def __init__(self):
+        super().__init__()
+        # Prime psutil's CPU counters so no sample needs a blocking window:
+        # each reading covers the time since the previous call (the first
+        # one only the moments since start-up, so it may read near 0%)
+        psutil.cpu_percent(interval=None)
+        # GPU and disk probes can stall on driver or mount I/O; they overlap
+        # with the CPU/RAM reads instead of queueing behind them
+        self._probes = ThreadPoolExecutor(max_workers=2, thread_name_prefix="probe")
+        self._disks: list = []
+        self._disks_at = float("-inf")
+
+    @Slot()
+    def sample(self):
+        """Gather all metrics; failures are forwarded under the "error" key."""
+        now = time.monotonic()
+        try:
+            gpus = self._probes.submit(get_gpu_info)
+            disks = None
+            if now - self._disks_at >= DISKS_TTL_S:
+                disks = self._probes.submit(get_disk_info)
+            metrics = {
+                "cpu": get_cpu_info(),
+                "ram": get_ram_info(),
+                "gpus": gpus.result(),
+            }
+            if disks is not None:
+                self._disks, self._disks_at = disks.result(), now
+            metrics["disks"] = self._disks
+        except Exception as e:
+            metrics = {"error": e}
+        self.sampled.emit(metrics)
+
+    def shutdown(self):
+        """Release the probe threads; call once sampling has stopped."""
+        self._probes.shutdown(wait=True)
+
+
 # --------- UI Widgets ---------
+def _compress_flat(values, tolerance: float = SPARK_FLAT_TOLERANCE):
+    """Reduce `values` to (index, value) points, keeping only the first and
+    last sample of each run that stays within `tolerance` of its start."""
+    points: list[tuple[int, float]] = []
+    n = len(values)
+    run_start = 0
+    for i in range(1, n + 1):
+        if i == n or abs(values[i] - values[run_start]) >= tolerance:
+            points.append((run_start, values[run_start]))
+            if i - 1 > run_start:
+                points.append((i - 1, values[i - 1]))
+            run_start = i
+    return points
+
+
+def sparkline_polygons(
+    points: list[tuple[int, float]], count: int, width: float, height: float
+) -> tuple[QPolygonF, QPolygonF]:
+    """Scale sparkline points into (line, fill) polygons for a width x height box.
+
+    `points` are (index, value) pairs from _compress_flat over a series of
+    `count` samples; indices keep their horizontal position.
+    """
+    # Calculate value range with padding
+    max_val = max(v for _, v in points)
+    min_val = min(v for _, v in points)
+    range_val = max_val - min_val if max_val != min_val else 1
+
+    # Add small padding to prevent line from touching edges
+    padding = height * 0.1
+    usable_height = height - (2 * padding)
+    baseline = padding + usable_height
+    scale = usable_height / range_val
+
+    # Calculate step between points
+    step = width / max(count - 1, 1)
+
+    # One polygon for the line; Qt strokes it in a single native call
+    line = QPolygonF(
+        [QPointF(i * step, baseline - (v - min_val) * scale) for i, v in points]
+    )
+
+    # Fill under the line: same vertices closed along the bottom edge
+    fill = QPolygonF(line)
+    fill.append(QPointF(width, height))
+    fill.append(QPointF(0, height))
+    return line, fill
+
+
+def paint_sparkline(painter: QPainter, line: QPolygonF, fill: QPolygonF):
+    """Paint the filled, glowing trend line from precomputed polygons."""
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+    # Draw fill first, then line
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(_INTERACTIVE_FILL)
+    painter.drawPolygon(fill)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.setPen(_SPARK_PEN)
+    painter.drawPolyline(line)
+
+    # Add subtle glow effect; invisible on small surfaces, so skip it there
+    if painter.device().width() >= SPARK_GLOW_MIN_PX:
+        painter.setPen(_SPARK_GLOW_PEN)
+        painter.drawPolyline(line)
+
+
+class _SparkSignals(QObject):
+    rendered = Signal(str, QImage)
+
+
+class SparkRenderJob(QRunnable):
+    """Paint one sparkline into a QImage on a pool thread."""
+
+    def __init__(self, key, points, count, width, height, dpr, on_rendered):
+        super().__init__()
+        self.key = key
+        self.points = points
+        self.count = count
+        self.width = width
+        self.height = height
+        self.dpr = dpr
+        self.on_rendered = on_rendered
+
+    def run(self):
+        # The job owns its signals object, created and destroyed on this
+        # thread; Qt drops the queued connection if the receiver goes away
+        signals = _SparkSignals()
+        try:
+            signals.rendered.connect(self.on_rendered)
+        except RuntimeError:
+            return  # Receiver deleted while the job was queued
+        # QImage (unlike QPixmap) may be painted outside the GUI thread
+        img = QImage(
+            int(self.width * self.dpr),
+            int(self.height * self.dpr),
+            QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        img.setDevicePixelRatio(self.dpr)
+        img.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(img)
+        paint_sparkline(
+            painter,
+            *sparkline_polygons(self.points, self.count, self.width, self.height),
+        )
+        painter.end()
+        signals.rendered.emit(self.key, img)
+
+
+class Sparkline(QWidget):
+    """Trend line served from QPixmapCache, rendered on the thread pool."""
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self._points: list[tuple[int, float]] = []
+        self._count = 0
+        # Scaled (line, fill) polygons, rebuilt only when data or size changes
+        self._polygons: Optional[tuple[QPolygonF, QPolygonF]] = None
+        # Series quantised to 8 bits; identical shapes share one cached pixmap
+        self._signature = ""
+        # Last pixmap drawn, shown while a newer one renders in the background
+        self._shown: Optional[QPixmap] = None
+        self._in_flight: Optional[str] = None
+
+    def set_data(self, values):
+        """Replace the plotted series and render it in the background."""
+        signature = bytes(min(max(int(v * 2.55), 0), 255) for v in values).hex()
+        if signature == self._signature:
+            return  # Same quantised shape and length: nothing to redraw
+        self._signature = signature
+        self._points = _compress_flat(values)
+        self._count = len(values)
+        self._polygons = None
+        key = self._cache_key()
+        if QPixmapCache.find(key) is not None or self._count < 2:
+            self.update()
+        elif key != self._in_flight:
+            self._in_flight = key
+            QThreadPool.globalInstance().start(
+                SparkRenderJob(
+                    key,
+                    self._points,
+                    self._count,
+                    self.width(),
+                    self.height(),
+                    self.devicePixelRatioF(),
+                    self._on_rendered,
+                )
+            )
+
+    @Slot(str, QImage)
+    def _on_rendered(self, key: str, img: QImage):
+        # PySide can still deliver a render queued just before the widget died
+        if not shiboken6.isValid(self):
+            return
+        QPixmapCache.insert(key, QPixmap.fromImage(img))
+        if key == self._in_flight:
+            self._in_flight = None
+        if key == self._cache_key():
+            self.update()
+
+    def resizeEvent(self, event):
+        self._polygons = None
+        super().resizeEvent(event)
+
+    def _cache_key(self) -> str:
+        dpr = self.devicePixelRatioF()
+        return f"spark:{self.width()}x{self.height()}@{dpr}:{self._signature}"
+
+    def _render(self, dpr: float) -> QPixmap:
+        if self._polygons is None:
+            self._polygons = sparkline_polygons(
+                self._points, self._count, self.width(), self.height()
+            )
+        pix = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pix)
+        paint_sparkline(painter, *self._polygons)
+        painter.end()
+        return pix
+
+    def paintEvent(self, event):
+        if self._count < 2:
+            return
+        key = self._cache_key()
+        pix = QPixmapCache.find(key)
+        if pix is None:
+            if key == self._in_flight and self._shown is not None:
+                pix = self._shown
+            else:
+                # Nothing to show yet (first paint, resize): render inline
+                pix = self._render(self.devicePixelRatioF())
+                QPixmapCache.insert(key, pix)
+        self._shown = pix
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, pix)
+        painter.end()
+
+
+class ContainerShadowFrame(QFrame):
+    """Frame that paints its children's shadows from cached nine-patch sprites.
+
+    ShadowManager.apply_shadow on a direct child only records the level; the
+    children themselves carry no QGraphicsDropShadowEffect, so N cards cost N
+    blits instead of N offscreen blur passes per frame.
+    """
+
+    shadow_radius = RADIUS["card"]
+
+    def childEvent(self, event):
+        super().childEvent(event)
+        if event.type() == QEvent.Type.ChildAdded:
+            child = event.child()
+            spec = getattr(child, "shadow_spec", None)
+            if spec is not None and child.isWidgetType():
+                child.installEventFilter(self)
+                ShadowManager.apply_shadow(child, *spec)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (
+            QEvent.Type.Move,
+            QEvent.Type.Resize,
+            QEvent.Type.Show,
+            QEvent.Type.Hide,
+        ):
+            self.update()
+        return super().eventFilter(obj, event)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        for child in self.children():
+            spec = getattr(child, "shadow_spec", None)
+            if spec is not None and child.isWidgetType() and child.isVisible():
+                ShadowManager.draw_shadow(
+                    painter, child.geometry(), *spec, radius=self.shadow_radius
+                )
+        painter.end()
+
+
 class Card(QFrame):
     """Enhanced metric card with perfected styling and accessibility."""
 
+    clicked = Signal(str)
+
     def __init__(self, key: str, title: str):
         super().__init__()
         self.key = key
@@ -562,48 +1455,7 @@ class Card(QFrame):
         # Apply native Qt shadow instead of CSS box-shadow
         ShadowManager.apply_shadow(self, "02")
 
-        # Enhanced styling with new design tokens (removed incompatible CSS)
-        self.setStyleSheet(
-            f"""
-            QFrame[objectName^="card_"] {{
-                background-color: {COLORS['layer-01']};
-                border: 1px solid {COLORS['border-subtle']};
-                border-radius: {RADIUS['card']}px;
-                padding: {SPACING['card-padding']};
-                /* Shadows now handled by ShadowManager */
-                /* Transitions now handled by AnimationManager and InteractionManager */
-            }}
-
-            QFrame[objectName^="card_"]:hover {{
-                background-color: {COLORS['layer-hover']};
-                border-color: {COLORS['border-interactive']};
-                /* Hover animations now handled by InteractionManager */
-            }}
-
-            QFrame[objectName^="card_"]:focus {{
-                outline: 2px solid {COLORS['focus']};
-                outline-offset: 2px;
-                border-color: {COLORS['border-interactive']};
-            }}
-
-            QFrame[objectName^="card_"][pressed="true"] {{
-                background-color: {COLORS['layer-active']};
-            }}
-
-            QFrame[objectName^="card_"][selected="true"] {{
-                background-color: {COLORS['layer-selected']};
-                border-color: {COLORS['interactive-01']};
-            }}
-
-            /* Loading state styling */
-            QFrame[objectName^="card_"][loading="true"] {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 {COLORS['layer-01']},
-                    stop:0.5 {COLORS['layer-hover']},
-                    stop:1 {COLORS['layer-01']});
-            }}
-            """
-        )
+        # Styled by the popup's sheet (STYLES["popup"]) through the card_ name
 
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
@@ -616,41 +1468,33 @@ class Card(QFrame):
 
         # Enhanced layout with better spacing
         layout = QVBoxLayout(self)
-        layout.setContentsMargins(
-            SPACING["lg"], SPACING["lg"], SPACING["lg"], SPACING["lg"]
-        )
+        margin = SPACING["lg"]
+        layout.setContentsMargins(margin, margin, margin, margin)
         layout.setSpacing(SPACING["md"])
 
         # Title with enhanced typography
+        # Python-side copies of the label texts; avoids Qt getter round trips
+        self._title = title
+        self._value_text = "Loading..."
         self.title_lbl = QLabel(title)
-        self.title_lbl.setStyleSheet(
-            f"{TYPOGRAPHY['heading-04']} color: {COLORS['text-primary']};"
-        )
+        self.title_lbl.setObjectName("card-title")
         self.title_lbl.setAccessibleName(f"{title} metric")
 
         # Value with enhanced typography and loading state
         self.value_lbl = QLabel("Loading...")
-        self.value_lbl.setStyleSheet(
-            f"{TYPOGRAPHY['value']} color: {COLORS['text-secondary']};"
-        )
+        self.value_lbl.setObjectName("card-value")
         self.value_lbl.setAccessibleName(f"{title} value")
 
         # Sparkline with improved styling
-        self.spark_lbl = QLabel()
+        self.spark_lbl = Sparkline()
         self.spark_lbl.setMinimumHeight(40)  # Increased height for better visibility
         self.spark_lbl.setMaximumHeight(40)
-        self.spark_lbl.setScaledContents(True)
         self.spark_lbl.setAccessibleName(f"{title} trend visualization")
 
         # Status indicator (new feature)
         self.status_indicator = QLabel()
         self.status_indicator.setFixedSize(8, 8)
-        self.status_indicator.setStyleSheet(
-            f"""
-            background-color: {COLORS['support-success']};
-            border-radius: 4px;
-            """
-        )
+        self.status_indicator.setStyleSheet(STYLES["status-normal"])
         self.status_indicator.hide()  # Hidden by default
 
         # Header layout with title and status
@@ -672,65 +1516,65 @@ class Card(QFrame):
         # Create opacity animation for loading effect
         self.loading_anim = QPropertyAnimation(self.loading_effect, b"opacity")
         self.loading_anim.setDuration(AnimationManager.DURATIONS["slow"])
-        self.loading_anim.setEasingCurve(AnimationManager.EASING["standard"])
+        self.loading_anim.setEasingCurve(AnimationManager.EASING_CURVES["standard"])
         self.loading_anim.setStartValue(0.3)
         self.loading_anim.setEndValue(1.0)
         self.loading_anim.setLoopCount(-1)
 
-        # Premium loading shimmer effect
-        self.shimmer_timer = QTimer(self)
-        self.shimmer_timer.setInterval(100)  # Update every 100ms
-        self.shimmer_step = 0
-        self.shimmer_timer.timeout.connect(self._update_shimmer)
+        # Tooltip text; Qt applies its own hover delay before showing it
+        self._additional_info: Optional[str] = None
+        self._tooltip_text = ""
 
-        # Tooltip timer for delayed tooltip display
-        self._tooltip_timer = QTimer(self)
-        self._tooltip_timer.setSingleShot(True)
-        self._tooltip_timer.setInterval(500)  # 500ms delay
-        self._tooltip_timer.timeout.connect(self._show_delayed_tooltip)
-        self._pending_tooltip = False
+        # Property changes repolish once per event loop turn (see _restyle)
+        self._restyle_timer = QTimer(self)
+        self._restyle_timer.setSingleShot(True)
+        self._restyle_timer.setInterval(0)
+        self._restyle_timer.timeout.connect(self._restyle)
 
         # State management
-        self._is_loading = True
+        self._is_loading = False  # Flipped by set_loading_state(True) below
         self._is_selected = False
+        self._pressed = False
         self._data_value = None
+        self._status: Optional[str] = None
 
         # Start loading animation
         self.set_loading_state(True)
 
-    def _update_shimmer(self):
-        """Update shimmer effect for loading state."""
-        if self._is_loading:
-            self.shimmer_step = (self.shimmer_step + 1) % 20
-            # Create shimmer effect by cycling through opacity values
-            alpha = 0.3 + 0.4 * (0.5 + 0.5 * (self.shimmer_step / 10))
-            self.loading_effect.setOpacity(alpha)
-
     def set_loading_state(self, loading: bool):
         """Set the loading state of the card."""
+        if loading == self._is_loading:
+            return
         self._is_loading = loading
         self.setProperty("loading", loading)
 
         if loading:
-            self.value_lbl.setText("Loading...")
+            self.set_value_text("Loading...")
+            self.loading_effect.setEnabled(True)
             self.loading_anim.start()
-            self.shimmer_timer.start()
             self.status_indicator.hide()
             # Apply special loading shadow
             ShadowManager.apply_shadow(self, "01")
         else:
             self.loading_anim.stop()
-            self.shimmer_timer.stop()
-            self.loading_effect.setOpacity(1.0)
+            # A disabled effect takes the label off the effect paint path
+            self.loading_effect.setEnabled(False)
             self.status_indicator.show()
             # Restore normal shadow
             ShadowManager.apply_shadow(self, "02")
 
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._restyle_timer.start()
+
+    def _restyle(self):
+        """Re-evaluate the stylesheet against the card's dynamic properties."""
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
 
     def set_selected_state(self, selected: bool):
         """Set the selected state of the card with enhanced visual feedback."""
+        if selected == self._is_selected:
+            return
         self._is_selected = selected
         self.setProperty("selected", selected)
 
@@ -742,77 +1586,68 @@ class Card(QFrame):
         else:
             ShadowManager.apply_shadow(self, "02")
 
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._restyle_timer.start()
 
     def set_status(self, status: str):
         """Set the status indicator color based on system state."""
-        colors = {
-            "normal": COLORS["support-success"],
-            "warning": COLORS["support-warning"],
-            "error": COLORS["support-error"],
-            "info": COLORS["support-info"],
-        }
-
-        color = colors.get(status, COLORS["support-success"])
+        if status == self._status:
+            return  # Re-applying the stylesheet would re-polish the indicator
+        self._status = status
+        sheet = STATUS_STYLES.get(status)
         self.status_indicator.setStyleSheet(
-            f"""
-            background-color: {color};
-            border-radius: 4px;
-            """
+            sheet if sheet is not None else STATUS_STYLES["normal"]
         )
 
+    def set_value_text(self, text: str) -> bool:
+        """Show `text` as the card value; returns False if it was already shown."""
+        if text == self._value_text:
+            return False
+        self._value_text = text
+        self.value_lbl.setText(text)
+        self._refresh_tooltip()
+        return True
+
     def update_value(self, value: str, raw_value: Optional[float] = None):
         """Update the card value with enhanced accessibility."""
         self._data_value = raw_value
-        self.value_lbl.setText(value)
-
-        # Update accessible description with current value
-        if raw_value is not None:
-            self.setAccessibleDescription(
-                f"{self.title_lbl.text()}: {value}. Click for detailed information."
-            )
+        if self.set_value_text(value):
+            # Update accessible description with current value
+            if raw_value is not None:
+                self.setAccessibleDescription(
+                    f"{self._title}: {value}. Click for detailed information."
+                )
 
         if self._is_loading:
             self.set_loading_state(False)
 
     def set_additional_info(self, info: str):
         """Set additional information for tooltip."""
+        if info == self._additional_info:
+            return
         self._additional_info = info
-
-    def enterEvent(self, event):
-        """Enhanced hover event with delayed tooltip."""
-        self._pending_tooltip = True
-        self._tooltip_timer.start()
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        """Enhanced leave event."""
-        self._pending_tooltip = False
-        self._tooltip_timer.stop()
-        self.setToolTip("")
-        super().leaveEvent(event)
-
-    def _show_delayed_tooltip(self):
-        """Show tooltip after delay if still hovering."""
-        if self._pending_tooltip and self._data_value is not None:
-            tooltip_text = f"{self.title_lbl.text()}: {self.value_lbl.text()}"
-            if hasattr(self, "_additional_info"):
+        self._refresh_tooltip()
+
+    def _refresh_tooltip(self):
+        """Rebuild the tooltip from the current value and additional info."""
+        tooltip_text = ""
+        if self._data_value is not None:
+            tooltip_text = f"{self._title}: {self._value_text}"
+            if self._additional_info is not None:
                 tooltip_text += f"\n{self._additional_info}"
+        if tooltip_text != self._tooltip_text:
+            self._tooltip_text = tooltip_text
             self.setToolTip(tooltip_text)
 
     def focusInEvent(self, event):
         """Enhanced focus handling."""
         self.setProperty("focus", True)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._restyle_timer.start()
         super().focusInEvent(event)
 
     def focusOutEvent(self, event):
         """Enhanced focus out handling."""
         self.setProperty("focus", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        self._restyle_timer.start()
         super().focusOutEvent(event)
 
     def keyPressEvent(self, event):
@@ -828,32 +1663,27 @@ class Card(QFrame):
     def mousePressEvent(self, event):
         """Enhanced mouse press with visual feedback."""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.setProperty("pressed", True)
-            self.style().unpolish(self)
-            self.style().polish(self)
+            if not self._pressed:
+                self._pressed = True
+                self.setProperty("pressed", True)
+                self._restyle_timer.start()
             self._trigger_click()
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         """Enhanced mouse release."""
-        self.setProperty("pressed", False)
-        self.style().unpolish(self)
-        self.style().polish(self)
+        if self._pressed:
+            self._pressed = False
+            self.setProperty("pressed", False)
+            self._restyle_timer.start()
         super().mouseReleaseEvent(event)
 
     def _trigger_click(self):
         """Trigger click action with accessibility support."""
-        try:
-            window = self.window()
-            if window and hasattr(window, "card_clicked"):
-                # Simple audio feedback alternative
-                print(f"Card clicked: {self.key}")  # Audio feedback for accessibility
-                getattr(window, "card_clicked")(self.key)
-        except Exception as e:
-            print(f"Card click error: {e}")  # Debug logging
+        self.clicked.emit(self.key)
 
 
-class HwPopup(QFrame):
+class HwPopup(ContainerShadowFrame):
     """Enhanced main application window with premium UX design system."""
 
     def __init__(self):
@@ -871,79 +1701,11 @@ class HwPopup(QFrame):
         self.animation_manager = AnimationManager()
         self.cards_interaction_managers = {}
 
-        # Apply premium window shadow
-        ShadowManager.apply_shadow(self, "05")
+        # No window shadow of our own: a top-level window has no pixels outside
+        # its rect to cast one into, and compositors draw their own
 
         # Enhanced styling with Qt-native shadows and animations
-        self.setStyleSheet(
-            f"""
-            #hwpopup {{
-                background-color: {COLORS['background']};
-                color: {COLORS['text-primary']};
-                border-radius: {RADIUS['modal']}px;
-                border: 1px solid {COLORS['border-subtle']};
-                /* Shadows now handled by ShadowManager */
-            }}
-
-            QLabel {{
-                color: {COLORS['text-primary']};
-                {TYPOGRAPHY['body-01']}
-            }}
-
-            QPushButton {{
-                background-color: {COLORS['button-secondary']};
-                color: {COLORS['text-primary']};
-                border: 1px solid {COLORS['border-subtle']};
-                border-radius: {RADIUS['button']}px;
-                padding: {SPACING['button-padding-sm']};
-                {TYPOGRAPHY['body-compact-01']}
-                /* Transitions now handled by AnimationManager */
-            }}
-
-            QPushButton:hover {{
-                background-color: {COLORS['button-secondary-hover']};
-                border-color: {COLORS['border-strong']};
-            }}
-
-            QPushButton:focus {{
-                outline: 2px solid {COLORS['focus']};
-                outline-offset: 2px;
-            }}
-
-            QPushButton:pressed {{
-                background-color: {COLORS['layer-active']};
-            }}
-
-            /* Close button specific styling */
-            QPushButton#close-button {{
-                background-color: transparent;
-                color: {COLORS['text-tertiary']};
-                border: none;
-                border-radius: {RADIUS['md']}px;
-                font-size: 16px;
-                font-weight: 600;
-                width: 32px;
-                height: 32px;
-            }}
-
-            QPushButton#close-button:hover {{
-                background-color: {COLORS['support-error']};
-                color: {COLORS['text-on-color']};
-            }}
-
-            QPushButton#close-button:focus {{
-                background-color: {COLORS['support-error']};
-                color: {COLORS['text-on-color']};
-                outline: 2px solid {COLORS['focus']};
-            }}
-
-            /* Loading state overlay */
-            QFrame#loading-overlay {{
-                background-color: rgba(0, 0, 0, 50);
-                border-radius: {RADIUS['modal']}px;
-            }}
-            """
-        )
+        self.setStyleSheet(STYLES["popup"])
 
         # Enhanced minimum size with better proportions
         self.setMinimumSize(QSize(600, 420))
@@ -955,15 +1717,27 @@ class HwPopup(QFrame):
         self.loading_timer.setSingleShot(True)
         self.loading_timer.timeout.connect(self._finish_initial_load)
 
+        # Latest sample published by HwApp.update_stats; details read only this
+        self._latest_metrics: dict = {}
+
+        # Coalesce rapid card clicks into a single details refresh per loop turn
+        self._pending_key: Optional[str] = None
+        self._details_refresh_timer = QTimer(self)
+        self._details_refresh_timer.setSingleShot(True)
+        self._details_refresh_timer.setInterval(0)
+        self._details_refresh_timer.timeout.connect(self._do_card_clicked)
+
+        # Wayland compositors own window placement, so geometry tweens are no-ops
+        self._is_wayland = QGuiApplication.platformName().startswith("wayland")
+
         # Premium entrance animation
         self.entrance_animation = None
         self._setup_entrance_animation()
 
         # Main layout with enhanced spacing
         self.root_layout = QVBoxLayout(self)
-        self.root_layout.setContentsMargins(
-            SPACING["2xl"], SPACING["2xl"], SPACING["2xl"], SPACING["2xl"]
-        )
+        margin = SPACING["2xl"]
+        self.root_layout.setContentsMargins(margin, margin, margin, margin)
         self.root_layout.setSpacing(SPACING["xl"])
 
         # --- Enhanced Header ---
@@ -973,7 +1747,10 @@ class HwPopup(QFrame):
         self._create_cards_grid()
 
         # --- Enhanced Details Panel ---
-        self._create_details_panel()
+        # Built on the first card click; many sessions never open it
+        self.details: Optional[QFrame] = None
+        self._details_index = self.root_layout.count()
+        self._details_height = 0
 
         # --- Enhanced Footer ---
         self._create_footer()
@@ -994,16 +1771,12 @@ class HwPopup(QFrame):
 
         # Main title with enhanced typography
         title = QLabel("System Hardware Monitor")
-        title.setStyleSheet(
-            f"{TYPOGRAPHY['heading-02']} color: {COLORS['text-primary']};"
-        )
+        title.setObjectName("app-title")
         title.setAccessibleName("Application title")
 
         # Subtitle for context
         subtitle = QLabel("Real-time system metrics")
-        subtitle.setStyleSheet(
-            f"{TYPOGRAPHY['body-compact-01']} color: {COLORS['text-secondary']};"
-        )
+        subtitle.setObjectName("app-subtitle")
         subtitle.setAccessibleName("Application description")
 
         # Title container
@@ -1041,6 +1814,15 @@ class HwPopup(QFrame):
         self.card_ram = Card("ram", "Memory")
         self.card_gpu = Card("gpu", "Graphics")
         self.card_disk = Card("disk", "Storage")
+        self.cards = {
+            "cpu": self.card_cpu,
+            "ram": self.card_ram,
+            "gpu": self.card_gpu,
+            "disk": self.card_disk,
+        }
+        self.card_list = list(self.cards.values())
+        for card in self.card_list:
+            card.clicked.connect(self.card_clicked)
 
         self.grid.addWidget(self.card_cpu, 0, 0)
         self.grid.addWidget(self.card_ram, 0, 1)
@@ -1050,31 +1832,18 @@ class HwPopup(QFrame):
         self.root_layout.addLayout(self.grid)
 
     def _create_details_panel(self):
-        """Create enhanced details panel with improved styling."""
+        """Create the details panel in its slot below the cards grid."""
         self.details = QFrame()
         self.details.setObjectName("details")
-        self.details.setStyleSheet(
-            f"""
-            #details {{
-                background-color: {COLORS['layer-02']};
-                border: 1px solid {COLORS['border-subtle']};
-                border-radius: {RADIUS['lg']}px;
-                {ELEVATION['02']}
-            }}
-            """
-        )
 
         self.details_layout = QVBoxLayout(self.details)
-        self.details_layout.setContentsMargins(
-            SPACING["xl"], SPACING["xl"], SPACING["xl"], SPACING["xl"]
-        )
+        margin = SPACING["xl"]
+        self.details_layout.setContentsMargins(margin, margin, margin, margin)
         self.details_layout.setSpacing(SPACING["md"])
 
         # Enhanced details title
         self.details_title = QLabel("Select a metric card for details")
-        self.details_title.setStyleSheet(
-            f"{TYPOGRAPHY['heading-03']} color: {COLORS['text-primary']};"
-        )
+        self.details_title.setObjectName("details-title")
         self.details_title.setAccessibleName("Details panel title")
 
         # Enhanced details body
@@ -1082,9 +1851,7 @@ class HwPopup(QFrame):
             "Click on any metric card above to view detailed information, trends, and system insights."
         )
         self.details_body.setWordWrap(True)
-        self.details_body.setStyleSheet(
-            f"{TYPOGRAPHY['body-01']} color: {COLORS['text-secondary']}; line-height: 1.5;"
-        )
+        self.details_body.setObjectName("details-body")
         self.details_body.setAccessibleName("Details panel content")
 
         self.details_layout.addWidget(self.details_title)
@@ -1095,7 +1862,16 @@ class HwPopup(QFrame):
         self.details.setGraphicsEffect(self.details_effect)
         self.details.setMaximumHeight(0)
 
-        self.root_layout.addWidget(self.details)
+        # Opacity animation only. Height snaps instead of animating:
+        # a maximumHeight tween relayouts the whole popup on every frame
+        self.details_anim_o = QPropertyAnimation(self.details_effect, b"opacity")
+        self.details_anim_o.setDuration(
+            int(ANIMATION["duration-fast"].replace("ms", ""))
+        )
+        self.details_anim_o.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.details_anim_o.finished.connect(self._on_details_faded)
+
+        self.root_layout.insertWidget(self._details_index, self.details)
 
     def _create_footer(self):
         """Create enhanced footer with additional information."""
@@ -1104,9 +1880,7 @@ class HwPopup(QFrame):
 
         # Status info
         status_text = QLabel("Wayland-friendly • Real-time monitoring")
-        status_text.setStyleSheet(
-            f"{TYPOGRAPHY['body-02']} color: {COLORS['text-tertiary']};"
-        )
+        status_text.setProperty("role", "footer")
         status_text.setAccessibleName("Application status")
 
         footer_layout.addWidget(status_text)
@@ -1114,9 +1888,7 @@ class HwPopup(QFrame):
 
         # Update interval info
         interval_text = QLabel(f"Updates every {UPDATE_INTERVAL_MS//1000}s")
-        interval_text.setStyleSheet(
-            f"{TYPOGRAPHY['body-02']} color: {COLORS['text-tertiary']};"
-        )
+        interval_text.setProperty("role", "footer")
         interval_text.setAccessibleName("Update interval information")
 
         footer_layout.addWidget(interval_text)
@@ -1127,22 +1899,24 @@ class HwPopup(QFrame):
         # Scale animation for entrance
         self.entrance_scale_anim = QPropertyAnimation(self, b"geometry")
         self.entrance_scale_anim.setDuration(AnimationManager.DURATIONS["moderate"])
-        self.entrance_scale_anim.setEasingCurve(AnimationManager.EASING["bounce"])
+        self.entrance_scale_anim.setEasingCurve(
+            AnimationManager.EASING_CURVES["bounce"]
+        )
 
         # Opacity animation for entrance
         self.entrance_opacity_anim = QPropertyAnimation(self, b"windowOpacity")
         self.entrance_opacity_anim.setDuration(AnimationManager.DURATIONS["fast"])
-        self.entrance_opacity_anim.setEasingCurve(AnimationManager.EASING["standard"])
+        self.entrance_opacity_anim.setEasingCurve(
+            AnimationManager.EASING_CURVES["standard"]
+        )
 
     def _finish_initial_load(self):
         """Finish initial loading state with smooth transition."""
         self.is_loading = False
         # Animate cards into view with staggered timing
-        for i, card in enumerate(
-            [self.card_cpu, self.card_ram, self.card_gpu, self.card_disk]
-        ):
+        for i, card in enumerate(self.card_list):
             # Stagger the animations by 100ms each
-            QTimer.singleShot(i * 100, lambda c=card: c.set_loading_state(False))
+            QTimer.singleShot(i * 100, partial(card.set_loading_state, False))
 
     def _create_loading_overlay(self):
         """Create premium loading overlay."""
@@ -1153,12 +1927,7 @@ class HwPopup(QFrame):
         # Loading spinner
         self.loading_spinner = QLabel("Loading...", self.loading_overlay)
         self.loading_spinner.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.loading_spinner.setStyleSheet(
-            f"""
-            color: {COLORS['text-primary']};
-            {TYPOGRAPHY['heading-02']}
-        """
-        )
+        self.loading_spinner.setObjectName("loading-spinner")
 
         # Position spinner in center
         overlay_layout = QVBoxLayout(self.loading_overlay)
@@ -1168,38 +1937,42 @@ class HwPopup(QFrame):
 
     def show_with_entrance_animation(self, screen):
         """Enhanced show with premium entrance animation."""
-        # Start with small scale and fade (skip opacity on Wayland)
-        try:
+        # Start with small scale and fade. Neither runs on Wayland: the
+        # compositor ignores windowOpacity, and resizing a toplevel every
+        # frame forces a buffer reallocation per step
+        use_opacity = use_scale = not self._is_wayland
+        if use_opacity:
             self.setWindowOpacity(0.0)
-            use_opacity = True
-        except:
-            use_opacity = False
-
-        original_geometry = self.geometry()
-
-        # Scale down initially
-        small_width = int(original_geometry.width() * 0.8)
-        small_height = int(original_geometry.height() * 0.8)
-        small_x = original_geometry.x() + (original_geometry.width() - small_width) // 2
-        small_y = (
-            original_geometry.y() + (original_geometry.height() - small_height) // 2
-        )
-        small_geometry = QRect(small_x, small_y, small_width, small_height)
 
-        self.setGeometry(small_geometry)
+        if use_scale:
+            original_geometry = self.geometry()
+
+            # Scale down initially
+            small_width = int(original_geometry.width() * 0.8)
+            small_height = int(original_geometry.height() * 0.8)
+            small_x = (
+                original_geometry.x() + (original_geometry.width() - small_width) // 2
+            )
+            small_y = (
+                original_geometry.y() + (original_geometry.height() - small_height) // 2
+            )
+            small_geometry = QRect(small_x, small_y, small_width, small_height)
+
+            self.setGeometry(small_geometry)
+            self.entrance_scale_anim.setStartValue(small_geometry)
+            self.entrance_scale_anim.setEndValue(original_geometry)
+
         self.show()
         self.raise_()
         self.activateWindow()
 
         # Animate to full size and opacity
-        self.entrance_scale_anim.setStartValue(small_geometry)
-        self.entrance_scale_anim.setEndValue(original_geometry)
-        self.entrance_opacity_anim.setStartValue(0.0)
-        self.entrance_opacity_anim.setEndValue(1.0)
-
-        # Start both animations
-        self.entrance_scale_anim.start()
-        self.entrance_opacity_anim.start()
+        if use_scale:
+            self.entrance_scale_anim.start()
+        if use_opacity:
+            self.entrance_opacity_anim.setStartValue(0.0)
+            self.entrance_opacity_anim.setEndValue(1.0)
+            self.entrance_opacity_anim.start()
 
         # Start initial loading process
         self.loading_timer.start(1000)  # Show loading for 1 second
@@ -1213,32 +1986,30 @@ class HwPopup(QFrame):
         )
         self.fade_anim.setEasingCurve(QEasingCurve.Type.OutCubic)
 
-        # Details panel height animation
-        self.details_anim_h = QPropertyAnimation(self.details, b"maximumHeight")
-        self.details_anim_h.setDuration(
-            int(ANIMATION["duration-moderate"].replace("ms", ""))
-        )
-        self.details_anim_h.setEasingCurve(QEasingCurve.Type.OutCubic)
-
-        # Details panel opacity animation
-        self.details_anim_o = QPropertyAnimation(self.details_effect, b"opacity")
-        self.details_anim_o.setDuration(
-            int(ANIMATION["duration-fast"].replace("ms", ""))
-        )
-        self.details_anim_o.setEasingCurve(QEasingCurve.Type.OutCubic)
-
     def card_clicked(self, key: str):
+        """Queue a details refresh; rapid clicks collapse into the last one."""
+        self._pending_key = key
+        self._details_refresh_timer.start()
+
+    def _do_card_clicked(self):
         """Enhanced card click handler with improved details."""
+        key = self._pending_key
+        if key is None:
+            return
+        self._pending_key = None
+
         # Clear any existing selection
-        for card in [self.card_cpu, self.card_ram, self.card_gpu, self.card_disk]:
+        for card in self.card_list:
             card.set_selected_state(False)
 
         # Set selected card
-        selected_card = getattr(self, f"card_{key}", None)
+        selected_card = self.cards.get(key)
         if selected_card:
             selected_card.set_selected_state(True)
 
         # Build enhanced details
+        if self.details is None:
+            self._create_details_panel()
         text = self._build_details_text(key)
         self.details_title.setText(f"{key.upper()} Metrics")
         self.details_body.setText(text)
@@ -1248,9 +2019,7 @@ class HwPopup(QFrame):
             # Account for margins, title, and content
             title_height = self.details_title.sizeHint().height()
             body_height = self.details_body.sizeHint().height()
-            margins = SPACING["xl"] * 2  # Top and bottom margins
-            spacing = SPACING["md"]  # Spacing between title and body
-            target_height = title_height + body_height + margins + spacing
+            target_height = title_height + body_height + _DETAILS_CHROME
             target_height = min(target_height, 200)  # Max height limit
         else:
             target_height = 0
@@ -1259,25 +2028,26 @@ class HwPopup(QFrame):
 
     def _animate_details_to(self, height: int):
         """Enhanced details animation with smooth transitions."""
-        self.details_anim_h.stop()
         self.details_anim_o.stop()
-
-        current_height = self.details.maximumHeight()
-        self.details_anim_h.setStartValue(current_height)
-        self.details_anim_h.setEndValue(height)
+        self._details_height = height
 
         if height > 0:
-            # Expanding: fade in after height animation starts
+            # Expanding: take the final height at once, then fade in
+            self.details.setMaximumHeight(height)
             self.details_anim_o.setStartValue(0.0)
             self.details_anim_o.setEndValue(1.0)
         else:
-            # Collapsing: fade out immediately
+            # Collapsing: fade out first; the space is released when done
             self.details_anim_o.setStartValue(1.0)
             self.details_anim_o.setEndValue(0.0)
 
-        self.details_anim_h.start()
         self.details_anim_o.start()
 
+    def _on_details_faded(self):
+        """Release the details panel's space once a collapse has faded out."""
+        if self._details_height == 0:
+            self.details.setMaximumHeight(0)
+
     def show_with_fade(self, screen):
         """Enhanced show with fade animation."""
         # Center window on screen
@@ -1286,12 +2056,10 @@ class HwPopup(QFrame):
         y = available_geometry.y() + (available_geometry.height() - self.height()) // 2
         self.move(x, y)
 
-        # Fade in animation (skip opacity on Wayland)
-        try:
+        # Fade in animation (skip opacity on Wayland, which ignores it)
+        use_opacity = not self._is_wayland
+        if use_opacity:
             self.setWindowOpacity(0.0)
-            use_opacity = True
-        except:
-            use_opacity = False
 
         self.show()
         self.raise_()
@@ -1302,109 +2070,25 @@ class HwPopup(QFrame):
             self.fade_anim.setEndValue(1.0)
             self.fade_anim.start()
 
-    def draw_sparkline(self, values: list[float], width: int = 140, height: int = 40):
-        """Enhanced sparkline with better styling and HiDPI support."""
-        device_pixel_ratio = 2  # HiDPI support
-        pix = QPixmap(width * device_pixel_ratio, height * device_pixel_ratio)
-        pix.setDevicePixelRatio(device_pixel_ratio)
-        pix.fill(Qt.GlobalColor.transparent)
-
-        if not values or len(values) < 2:
-            return pix
-
-        painter = QPainter(pix)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Enhanced pen with proper color from design tokens
-        pen = QPen(QColor(COLORS["interactive-01"]))
-        pen.setWidth(3)  # Slightly thicker line for better visibility
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-        painter.setPen(pen)
-
-        # Calculate value range with padding
-        max_val = max(values)
-        min_val = min(values)
-        range_val = max_val - min_val if max_val != min_val else 1
-
-        # Add small padding to prevent line from touching edges
-        padding = height * 0.1
-        usable_height = height - (2 * padding)
-
-        # Calculate step between points
-        step = width / max(len(values) - 1, 1)
-
-        # Draw gradient fill under the line
-        gradient_brush = QColor(COLORS["interactive-01"])
-        gradient_brush.setAlpha(30)  # 30% opacity
-        painter.setBrush(gradient_brush)
-
-        # Create path for line and fill
-        from PySide6.QtGui import QPainterPath
-
-        path = QPainterPath()
-        fill_path = QPainterPath()
-
-        # Calculate first point
-        first_y = (
-            padding
-            + usable_height
-            - ((values[0] - min_val) / range_val) * usable_height
-        )
-        path.moveTo(0, first_y)
-        fill_path.moveTo(0, height)
-        fill_path.lineTo(0, first_y)
-
-        # Draw line through all points
-        for i, value in enumerate(values):
-            x = i * step
-            y = (
-                padding
-                + usable_height
-                - ((value - min_val) / range_val) * usable_height
-            )
-
-            if i == 0:
-                continue
-
-            path.lineTo(x, y)
-            fill_path.lineTo(x, y)
-
-        # Complete fill path
-        fill_path.lineTo(width, height)
-        fill_path.closeSubpath()
-
-        # Draw fill first, then line
-        painter.fillPath(fill_path, gradient_brush)
-        painter.strokePath(path, pen)
-
-        # Add subtle glow effect
-        glow_pen = QPen(QColor(COLORS["interactive-01"]))
-        glow_pen.setWidth(5)
-        glow_pen.setColor(QColor(COLORS["interactive-01"]))
-        glow_color = QColor(COLORS["interactive-01"])
-        glow_color.setAlpha(20)
-        glow_pen.setColor(glow_color)
-        painter.setPen(glow_pen)
-        painter.strokePath(path, glow_pen)
-
-        painter.end()
-        return pix
-
     def _build_details_text(self, key: str) -> str:
+        # Only the worker's newest sample is used, however old: sampling here
+        # would race MetricsWorker on psutil's CPU baseline and the GPU state
+        metrics = self._latest_metrics
+        if not metrics:
+            return "Waiting for the first sample..."
         try:
             if key == "cpu":
-                cpu = get_cpu_info()
+                cpu = metrics["cpu"]
                 return (
                     f"Usage: {cpu['usage']:.1f}%\nTemp: {cpu['temp']}°C"
                     if cpu["temp"] is not None
                     else f"Usage: {cpu['usage']:.1f}%"
                 )
             if key == "ram":
-                ram = get_ram_info()
+                ram = metrics["ram"]
                 return f"Used: {ram['used_gb']} GiB\nTotal: {ram['total_gb']} GiB\nPercent: {ram['percent']:.1f}%"
             if key == "gpu":
-                gpus = get_gpu_info()
+                gpus = metrics["gpus"]
                 if not gpus:
                     return "No GPU info available"
                 lines = []
@@ -1426,7 +2110,7 @@ class HwPopup(QFrame):
                     )
                 return "\n".join(lines)
             if key == "disk":
-                parts = get_disk_info()
+                parts = metrics["disks"]
                 if not parts:
                     return "No disk info"
                 return "\n".join(
@@ -1445,7 +2129,10 @@ class HwPopup(QFrame):
 
 
 # --------- App wrapper ---------
-class HwApp:
+class HwApp(QObject):
+    _ERROR_FMT = "Failed to load data: {}..."
+    _ERROR_LOG_INTERVAL = 5.0  # Seconds between repeated failure log lines
+
     def __init__(self):
         try:
             QGuiApplication.setAttribute(
@@ -1453,67 +2140,116 @@ class HwApp:
             )
         except Exception:
             pass
-        self.app = QApplication([])
+        app = QApplication([])
+        super().__init__()
+        self.app = app
+        self._last_error_log = float("-inf")
+        # Inputs each card's additional info was last formatted from
+        self._info_inputs: dict[str, object] = {}
         self.app.setApplicationName("pytfredon-hw-gui")
+        QPixmapCache.setCacheLimit(SPARK_CACHE_KB)
         try:
             self.app.setStyle("Fusion")
         except Exception:
             pass
         self.popup = HwPopup()
+        # Samples that queue up while the GUI is busy collapse into the newest
+        self._pending_sample: Optional[dict] = None
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.setInterval(0)
+        self._stats_timer.timeout.connect(self._flush_sample)
         scr = QGuiApplication.screenAt(QCursor.pos()) or self.app.primaryScreen()
         self.popup.show_with_entrance_animation(scr)
-        self.timer = QTimer()
-        self.timer.setInterval(UPDATE_INTERVAL_MS)
-        self.timer.timeout.connect(self.update_stats)
-        self.timer.start()
-        self.update_stats()  # Initial call
 
-    def update_stats(self):
+        # Metrics are sampled on a worker thread; the GUI thread only applies them
+        self.worker_thread = QThread()
+        self.worker = MetricsWorker()
+        self.timer = QTimer(self.worker)  # Moves to the worker thread with its parent
+        self.timer.setInterval(UPDATE_INTERVAL_MS)
+        self.timer.timeout.connect(self.worker.sample)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.sampled.connect(self.queue_stats)
+        self.worker_thread.started.connect(self.worker.sample)  # Initial call
+        self.worker_thread.started.connect(self.timer.start)
+        self.app.aboutToQuit.connect(self._stop_worker)
+        # Sampling is background work; never let it preempt input or painting
+        self.worker_thread.start(QThread.Priority.LowPriority)
+
+    def _stop_worker(self):
+        # The timer lives on the worker thread, so it must be stopped there
+        QMetaObject.invokeMethod(
+            self.timer, "stop", Qt.ConnectionType.BlockingQueuedConnection
+        )
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        self.worker.shutdown()
+
+    @Slot(dict)
+    def queue_stats(self, metrics: dict):
+        """Queue a sample; ones arriving before the next pass are dropped."""
+        self._pending_sample = metrics
+        self._stats_timer.start()
+
+    def _flush_sample(self):
+        metrics = self._pending_sample
+        if metrics is None:
+            return
+        self._pending_sample = None
+        self.update_stats(metrics)
+
+    def update_stats(self, metrics: dict):
         """Enhanced statistics update with better error handling and accessibility."""
-        try:
-            # Gather system metrics
-            cpu = get_cpu_info()
-            ram = get_ram_info()
-            gpus = get_gpu_info()
-            disks = get_disk_info()
-
-            # Update CPU card
-            cpu_usage = float(cpu.get("usage", 0) or 0)
-            self.popup.card_cpu.update_value(f"{cpu_usage:.0f}%", cpu_usage)
-            cpu_temp = cpu.get("temp")
-            if cpu_temp is not None:
-                self.popup.card_cpu.set_additional_info(f"Temperature: {cpu_temp}°C")
-                self.popup.card_cpu.set_status(
-                    "normal"
-                    if cpu_temp < 80
-                    else "warning" if cpu_temp < 90 else "error"
-                )
-            else:
-                self.popup.card_cpu.set_status("normal")
-
-            # Update RAM card
-            ram_percent = float(ram.get("percent", 0) or 0)
-            self.popup.card_ram.update_value(f"{ram_percent:.0f}%", ram_percent)
-            ram_info = f"Used: {ram['used_gb']:.1f} GiB / {ram['total_gb']:.1f} GiB"
-            self.popup.card_ram.set_additional_info(ram_info)
-            self.popup.card_ram.set_status(
-                "normal"
-                if ram_percent < 80
-                else "warning" if ram_percent < 90 else "error"
+        error = metrics.get("error")
+        if error is not None:
+            self._show_error_state(error)
+            return
+
+        self.popup._latest_metrics = metrics
+        usage = _usage_of(metrics)
+        for key, value in usage.items():
+            HISTORY[key].append(value)
+        self._apply_metrics(metrics, usage)
+
+    def _apply_metrics(self, metrics: dict, usage: dict[str, float]):
+        cpu = metrics["cpu"]
+        ram = metrics["ram"]
+        gpus = metrics["gpus"]
+        disks = metrics["disks"]
+        card_cpu, card_ram, card_gpu, card_disk = self.popup.card_list
+
+        # Update CPU card
+        cpu_usage = usage["cpu"]
+        card_cpu.update_value(f"{cpu_usage:.0f}%", cpu_usage)
+        cpu_temp = cpu.get("temp")
+        if cpu_temp is not None:
+            if self._info_changed("cpu", cpu_temp):
+                card_cpu.set_additional_info(f"Temperature: {cpu_temp}°C")
+            card_cpu.set_status(_status(cpu_temp))
+        else:
+            card_cpu.set_status("normal")
+
+        # Update RAM card
+        ram_percent = usage["ram"]
+        card_ram.update_value(f"{ram_percent:.0f}%", ram_percent)
+        if self._info_changed("ram", (ram["used_gb"], ram["total_gb"])):
+            card_ram.set_additional_info(
+                f"Used: {ram['used_gb']:.1f} GiB / {ram['total_gb']:.1f} GiB"
             )
-
-            # Update GPU card
-            gpu_util = 0.0
-            gpu_info = "No GPU detected"
-            if gpus:
-                try:
-                    gpu = gpus[0]
-                    gpu_util = float(gpu.get("util", 0) or 0)
-                    gpu_name = gpu.get("name", "GPU")
-                    gpu_temp = gpu.get("temp")
-                    gpu_mem_used = gpu.get("mem_used_gb")
-                    gpu_mem_total = gpu.get("mem_total_gb")
-
+        card_ram.set_status(_status(ram_percent))
+
+        # Update GPU card
+        gpu_util = usage["gpu"]
+        gpu_info = "No GPU detected"
+        if gpus:
+            gpu = gpus[0]
+            gpu_name = gpu.get("name", "GPU")
+            gpu_temp = gpu.get("temp")
+            gpu_mem_used = gpu.get("mem_used_gb")
+            gpu_mem_total = gpu.get("mem_total_gb")
+            gpu_inputs = (gpu_name, gpu_temp, gpu_mem_used, gpu_mem_total)
+            try:
+                if self._info_changed("gpu", gpu_inputs):
                     gpu_info = f"Device: {gpu_name}"
                     if gpu_temp is not None:
                         gpu_info += f"\nTemperature: {gpu_temp}°C"
@@ -1521,84 +2257,74 @@ class HwApp:
                         gpu_info += (
                             f"\nMemory: {gpu_mem_used:.1f} / {gpu_mem_total:.1f} GiB"
                         )
+                    card_gpu.set_additional_info(gpu_info)
 
-                    self.popup.card_gpu.set_status(
-                        "normal"
-                        if gpu_util < 80
-                        else "warning" if gpu_util < 95 else "error"
-                    )
-                except (ValueError, TypeError):
-                    gpu_util = 0.0
-                    self.popup.card_gpu.set_status("error")
-            else:
-                self.popup.card_gpu.set_status("info")
-
-            self.popup.card_gpu.update_value(f"{gpu_util:.0f}%", gpu_util)
-            self.popup.card_gpu.set_additional_info(gpu_info)
-
-            # Update Disk card
-            disk_percent = 0.0
-            disk_info = "No disks detected"
-            if disks:
-                disk = disks[0]  # Primary disk
-                disk_percent = float(disk.get("percent", 0) or 0)
+                card_gpu.set_status(_status(gpu_util, _GPU_STATUS_BINS))
+            except (ValueError, TypeError):
+                card_gpu.set_status("error")
+        else:
+            card_gpu.set_status("info")
+            if self._info_changed("gpu", None):
+                card_gpu.set_additional_info(gpu_info)
+
+        card_gpu.update_value(f"{gpu_util:.0f}%", gpu_util)
+
+        # Update Disk card
+        disk_percent = usage["disk"]
+        disk_info = "No disks detected"
+        if disks:
+            disk = disks[0]  # Primary disk
+            if self._info_changed("disk", (disk["device"], disk["mount"], len(disks))):
                 disk_info = f"Device: {disk['device']}\nMount: {disk['mount']}"
                 if len(disks) > 1:
                     disk_info += f"\n{len(disks)} storage devices total"
+                card_disk.set_additional_info(disk_info)
 
-                self.popup.card_disk.set_status(
-                    "normal"
-                    if disk_percent < 80
-                    else "warning" if disk_percent < 90 else "error"
-                )
-            else:
-                self.popup.card_disk.set_status("info")
-
-            self.popup.card_disk.update_value(f"{disk_percent:.0f}%", disk_percent)
-            self.popup.card_disk.set_additional_info(disk_info)
-
-            # Update history for sparklines
-            HISTORY["cpu"].append(cpu_usage)
-            HISTORY["ram"].append(ram_percent)
-            HISTORY["gpu"].append(gpu_util)
-            HISTORY["disk"].append(disk_percent)
-
-            # Maintain history size
-            for key in HISTORY:
-                HISTORY[key] = HISTORY[key][-HISTORY_MAX:]
-
-                # Update sparklines with enhanced styling
-                card = getattr(self.popup, f"card_{key}")
-                if len(HISTORY[key]) > 1:
-                    pixmap = self.popup.draw_sparkline(HISTORY[key])
-                    if pixmap:
-                        card.spark_lbl.setPixmap(pixmap)
-
-        except Exception as e:
-            print(f"Error updating stats: {e}")  # Debug logging
-            # Set error state for all cards with enhanced visual feedback
-            for card in [
-                self.popup.card_cpu,
-                self.popup.card_ram,
-                self.popup.card_gpu,
-                self.popup.card_disk,
-            ]:
-                card.set_status("error")
-                card.value_lbl.setText("Error")
-                card.set_additional_info(f"Failed to load data: {str(e)[:50]}...")
-
-                # Add error animation
-                error_animation = AnimationManager.animate_opacity(card, 0.7, "fast")
-                # After error animation, restore opacity
-                QTimer.singleShot(
-                    300, lambda c=card: AnimationManager.animate_opacity(c, 1.0, "fast")
-                )
+            card_disk.set_status(_status(disk_percent))
+        else:
+            card_disk.set_status("info")
+            if self._info_changed("disk", None):
+                card_disk.set_additional_info(disk_info)
+
+        card_disk.update_value(f"{disk_percent:.0f}%", disk_percent)
+
+        # Update sparklines; set_data itself skips a series whose quantised
+        # shape has not changed, so a steady reading costs no repaint
+        for key, card in self.popup.cards.items():
+            if len(HISTORY[key]) > 1:
+                card.spark_lbl.set_data(HISTORY[key])
+
+    def _info_changed(self, key: str, inputs) -> bool:
+        """Record the values behind a card's info text; False if unchanged."""
+        if key in self._info_inputs and self._info_inputs[key] == inputs:
+            return False
+        self._info_inputs[key] = inputs
+        return True
+
+    def _show_error_state(self, e: Exception):
+        """Flag every card as failed after a metrics sample could not be taken."""
+        # A persistent failure repeats every tick; log it at most every few seconds
+        now = time.monotonic()
+        if now - self._last_error_log >= self._ERROR_LOG_INTERVAL:
+            self._last_error_log = now
+            _log.warning("Error updating stats: %s", e)
+        message = self._ERROR_FMT.format(str(e)[:50])
+        self._info_inputs.clear()  # The error text replaces every card's info
+        pulse = AnimationManager.animate_opacity_pulse
+        # Set error state for all cards with enhanced visual feedback
+        for card in self.popup.card_list:
+            card.set_status("error")
+            card.set_value_text("Error")
+            card.set_additional_info(message)
+
+            # Add error animation
+            pulse(card, 0.7, "slow")
 
     def run(self):
-        try:
-            sys.exit(self.app.exec())
-        except KeyboardInterrupt:
-            sys.exit(0)
+        # Python handlers only run between Qt callbacks; the metrics ticks
+        # give Ctrl-C a chance to be seen and quit the loop cleanly
+        signal.signal(signal.SIGINT, lambda *_: self.app.quit())
+        sys.exit(self.app.exec())
 
 
 def main():
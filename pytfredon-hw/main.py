@@ -1,18 +1,37 @@
 #!/usr/bin/env python3
 
 
+import atexit
+import gzip
 import psutil
 import threading
 import time
 import os
-from flask import Flask, jsonify, send_from_directory, render_template_string
+from flask import Flask, request, send_from_directory
 
 import sys
 
 # Flask app must be defined before route decorators
 app = Flask(__name__, static_folder="static")
-# hwinfo cache
+# hwinfo cache, refreshed on demand once it is older than HWINFO_TTL_S
+HWINFO_TTL_S = 10
 hwinfo = {"cpu": {}, "ram": {}, "gpu": {}, "disk": {}, "gpus": [], "disks": []}
+# (monotonic refresh time, compact JSON, full JSON), published as one tuple.
+# The compact body leaves out the per-component "sensors" tables, which only
+# the details modal shows; it asks for the full body with ?detail=1
+_snapshot = (float("-inf"), b"", b"")
+_snapshot_lock = threading.Lock()
+# Set, then replaced, by every refresh; streams wait on it to push at once
+_snapshot_refreshed = threading.Event()
+# Each open stream holds a server thread, so they are capped per process and
+# closed after STREAM_MAX_S; EventSource then reconnects on its own, and a
+# page turned away with 204 polls /api/hwinfo until it retries the stream.
+# Idle streams send a comment every STREAM_PING_S: a dropped connection only
+# shows up as a failed write, and that is what frees its slot
+MAX_STREAMS = 2
+STREAM_MAX_S = 300
+STREAM_PING_S = 1
+_stream_slots = threading.BoundedSemaphore(MAX_STREAMS)
 
 
 # Optional GPU libraries
@@ -30,6 +49,52 @@ try:
 except ImportError:
     AMDGPU_AVAILABLE = False
 
+# GPU devices and their names, enumerated once at import. nvmlInit loads the
+# driver and walks the device tree, far too slow to repeat on every poll
+NVML_DEVICES = []  # (handle, name)
+AMD_DEVICES = []  # (GPUInfo, name)
+
+if NVML_AVAILABLE:
+    try:
+        pynvml.nvmlInit()
+    except Exception:
+        NVML_AVAILABLE = False
+if NVML_AVAILABLE:
+    try:
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):
+                name = name.decode("utf-8")
+            NVML_DEVICES.append((handle, name))
+    except Exception:
+        NVML_DEVICES.clear()
+        NVML_AVAILABLE = False
+        pynvml.nvmlShutdown()
+    else:
+        atexit.register(pynvml.nvmlShutdown)
+
+if AMDGPU_AVAILABLE and not NVML_AVAILABLE:
+    try:
+        for i in range(pyamdgpuinfo.detect_gpus()):
+            gpu = pyamdgpuinfo.get_gpu(i)
+            if gpu:
+                try:
+                    name = gpu.query_name()
+                except Exception:
+                    name = "AMD GPU"
+                AMD_DEVICES.append((gpu, name))
+    except Exception:
+        AMD_DEVICES.clear()
+
+# Optional fast JSON encoder for /api/hwinfo; Flask's own is the fallback
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @app.route("/api/exit", methods=["POST"])
 def api_exit():
@@ -37,8 +102,30 @@ def api_exit():
     return "", 200
 
 
+def _read_cpu_model():
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":")[1].strip()
+    except Exception:
+        pass
+    return "Unknown CPU"
+
+
+# The model string cannot change while the process runs; read it once
+CPU_MODEL = _read_cpu_model()
+
+# Prime the CPU counters; every later sample then covers the time since the
+# previous refresh instead of sleeping through its own measurement window
+psutil.cpu_percent(interval=None)
+
+
 def get_cpu_info():
-    cpu_percent = psutil.cpu_percent(interval=0.5)
+    # Non-blocking: usage since the previous call (primed at import). Calls
+    # are at least HWINFO_TTL_S apart, since refresh_hwinfo runs only under
+    # _snapshot_lock once the snapshot has gone stale
+    cpu_percent = psutil.cpu_percent(interval=None)
     cpu_temp = None
     sensors = {}
     try:
@@ -60,15 +147,7 @@ def get_cpu_info():
             cpu_temp = temps["cpu_thermal"][0].current
     except Exception:
         pass
-    cpu_model = "Unknown CPU"
-    try:
-        with open("/proc/cpuinfo", "r") as f:
-            for line in f:
-                if line.startswith("model name"):
-                    cpu_model = line.split(":")[1].strip()
-                    break
-    except Exception:
-        pass
+    cpu_model = CPU_MODEL
     # Provide a best-display metric and compact fields for frontend
     best_metric = None
     best_label = None
@@ -91,10 +170,14 @@ def get_cpu_info():
     }
 
 
+# Bytes -> GiB as one multiply; exact, since 1024**3 is a power of two
+GIB_INV = 1.0 / 1024**3
+
+
 def get_ram_info():
     ram = psutil.virtual_memory()
-    ram_total_gb = round(ram.total / (1024**3), 2)
-    ram_used_gb = round(ram.used / (1024**3), 2)
+    ram_total_gb = round(ram.total * GIB_INV, 2)
+    ram_used_gb = round(ram.used * GIB_INV, 2)
     ram_details = f"{int(ram_total_gb)}GB RAM"
     # RAM: prefer available/used as main readable metric if usage percent isn't meaningful
     main_metric = f"{ram_used_gb}GB / {ram_total_gb}GB"
@@ -114,13 +197,7 @@ def get_gpu_info():
     gpus = []
     if NVML_AVAILABLE:
         try:
-            pynvml.nvmlInit()
-            device_count = pynvml.nvmlDeviceGetCount()
-            for i in range(device_count):
-                handle = pynvml.nvmlDeviceGetHandleByIndex(i)
-                name = pynvml.nvmlDeviceGetName(handle)
-                if isinstance(name, bytes):
-                    name = name.decode("utf-8")
+            for handle, name in NVML_DEVICES:
                 util = pynvml.nvmlDeviceGetUtilizationRates(handle)
                 gpu_util = util.gpu
                 mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
@@ -149,110 +226,189 @@ def get_gpu_info():
                         "sensors": sensors,
                     }
                 )
-            pynvml.nvmlShutdown()
         except Exception:
             pass
     elif AMDGPU_AVAILABLE:
         try:
-            device_count = pyamdgpuinfo.detect_gpus()
-            for i in range(device_count):
-                gpu = pyamdgpuinfo.get_gpu(i)
-                if gpu:
-                    try:
-                        name = gpu.query_name()
-                    except Exception:
-                        name = "AMD GPU"
-                    try:
-                        util = gpu.query_load() * 100
-                    except Exception:
-                        util = 0
-                    try:
-                        temp = gpu.query_temperature()
-                    except Exception:
-                        temp = None
-                    sensors = {}
-                    best_metric = temp if temp is not None else util
-                    best_label = "Temp (°C)" if temp is not None else "Usage (%)"
-                    gpus.append(
-                        {
-                            "name": name,
-                            "main_metric": best_metric,
-                            "main_metric_label": best_label,
-                            "raw_usage": util,
-                            "label_value": temp,
-                            "label_name": "Temp (°C)",
-                            "sensors": sensors,
-                        }
-                    )
+            for gpu, name in AMD_DEVICES:
+                try:
+                    util = gpu.query_load() * 100
+                except Exception:
+                    util = 0
+                try:
+                    temp = gpu.query_temperature()
+                except Exception:
+                    temp = None
+                sensors = {}
+                best_metric = temp if temp is not None else util
+                best_label = "Temp (°C)" if temp is not None else "Usage (%)"
+                gpus.append(
+                    {
+                        "name": name,
+                        "main_metric": best_metric,
+                        "main_metric_label": best_label,
+                        "raw_usage": util,
+                        "label_value": temp,
+                        "label_name": "Temp (°C)",
+                        "sensors": sensors,
+                    }
+                )
         except Exception:
             pass
     return gpus
 
 
+# Root and home partitions with the time they were listed. Mounts change far
+# less often than the snapshot, so only disk_usage runs on every refresh
+PARTITIONS_TTL_S = 300
+_partitions = (float("-inf"), [])
+
+
+def _watched_partitions():
+    global _partitions
+    listed_at, partitions = _partitions
+    now = time.monotonic()
+    if now - listed_at > PARTITIONS_TTL_S:
+        partitions = [
+            p
+            for p in psutil.disk_partitions()
+            if p.fstype and p.mountpoint in ["/", "/home"]
+        ]
+        _partitions = (now, partitions)
+    return partitions
+
+
 def get_disk_info():
     disks = []
-    partitions = psutil.disk_partitions()
-    for partition in partitions:
-        if partition.fstype and partition.mountpoint in ["/", "/home"]:
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                percent = (usage.used / usage.total) * 100
-                disk_model = "NVMe SSD" if "nvme" in partition.device else "SSD/HDD"
-                sensors = {}
-                # Provide free space as main, available/used as label
-                disks.append(
-                    {
-                        "device": partition.device,
-                        "mountpoint": partition.mountpoint,
-                        "main_metric": round(usage.free / (1024**3), 2),
-                        "main_metric_label": "Free (GB)",
-                        "label_value": f"{round(usage.used / (1024**3), 2)}GB / {round(usage.total / (1024**3), 2)}GB",
-                        "label_name": "Used / Total (GB)",
-                        "model": disk_model,
-                        "sensors": sensors,
-                    }
-                )
-            except Exception:
-                pass
+    for partition in _watched_partitions():
+        try:
+            usage = psutil.disk_usage(partition.mountpoint)
+            disk_model = "NVMe SSD" if "nvme" in partition.device else "SSD/HDD"
+            sensors = {}
+            # Provide free space as main, available/used as label
+            disks.append(
+                {
+                    "device": partition.device,
+                    "mountpoint": partition.mountpoint,
+                    "main_metric": round(usage.free * GIB_INV, 2),
+                    "main_metric_label": "Free (GB)",
+                    "label_value": f"{round(usage.used * GIB_INV, 2)}GB / {round(usage.total * GIB_INV, 2)}GB",
+                    "label_name": "Used / Total (GB)",
+                    "model": disk_model,
+                    "sensors": sensors,
+                }
+            )
+        except Exception:
+            pass
     return disks
 
 
-# --- Background Thread ---
+# --- Snapshot ---
+
 
+def _encode_json(obj):
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return app.json.dumps(obj).encode()
 
-def update_hwinfo():
-    global hwinfo
-    while True:
-        cpu = get_cpu_info()
-        ram = get_ram_info()
-        gpus = get_gpu_info()
-        disks = get_disk_info()
-        # Use first GPU and root disk for summary
-        gpu = gpus[0] if gpus else None
-        disk = next(
-            (d for d in disks if d["mountpoint"] == "/"), disks[0] if disks else None
+
+def _without_sensors(info):
+    if not info:
+        return info
+    return {k: v for k, v in info.items() if k != "sensors"}
+
+
+def refresh_hwinfo():
+    global hwinfo, _snapshot, _snapshot_refreshed
+    cpu = get_cpu_info()
+    ram = get_ram_info()
+    gpus = get_gpu_info()
+    disks = get_disk_info()
+    # Use first GPU and root disk for summary
+    gpu = gpus[0] if gpus else None
+    disk = next(
+        (d for d in disks if d["mountpoint"] == "/"), disks[0] if disks else None
+    )
+    hwinfo = {
+        "cpu": cpu,
+        "ram": ram,
+        "gpu": gpu,
+        "disk": disk,
+        "gpus": gpus,
+        "disks": disks,
+    }
+    compact = {
+        key: (
+            [_without_sensors(v) for v in value]
+            if isinstance(value, list)
+            else _without_sensors(value)
         )
-        hwinfo = {
-            "cpu": cpu,
-            "ram": ram,
-            "gpu": gpu,
-            "disk": disk,
-            "gpus": gpus,
-            "disks": disks,
-        }
-        time.sleep(10)
+        for key, value in hwinfo.items()
+    }
+    # Encoded once per refresh; every request until the next one reuses them
+    _snapshot = (time.monotonic(), _encode_json(compact), _encode_json(hwinfo))
+    refreshed, _snapshot_refreshed = _snapshot_refreshed, threading.Event()
+    refreshed.set()
 
 
-@app.route("/api/hwinfo")
-def api_hwinfo():
-    return jsonify(hwinfo)
+def current_snapshot():
+    # Sample only while someone is asking; concurrent requests for a stale
+    # snapshot wait on the lock and share a single refresh
+    if time.monotonic() - _snapshot[0] > HWINFO_TTL_S:
+        with _snapshot_lock:
+            if time.monotonic() - _snapshot[0] > HWINFO_TTL_S:
+                refresh_hwinfo()
+    return _snapshot
 
 
-@app.route("/")
-def index():
-    # Serve the main HTML page
-    return render_template_string(
-        """
+@app.route("/api/hwinfo")
+def api_hwinfo():
+    ts, compact, full = current_snapshot()
+    detail = request.args.get("detail") == "1"
+    response = app.response_class(
+        full if detail else compact, mimetype="application/json"
+    )
+    # Clients may reuse the body until the snapshot goes stale, then
+    # revalidate with If-None-Match and get a 304 if nothing was refreshed
+    response.set_etag(f"{ts!r}-{'full' if detail else 'compact'}")
+    response.cache_control.max_age = max(0, int(HWINFO_TTL_S - (time.monotonic() - ts)))
+    return response.make_conditional(request)
+
+
+@app.route("/api/hwinfo/stream")
+def api_hwinfo_stream():
+    # Server-sent events: each snapshot is pushed once, so open pages no
+    # longer poll; the stream itself triggers the refresh when one is due
+    if not _stream_slots.acquire(blocking=False):
+        return "", 204
+
+    def events():
+        yield f"retry: {int(HWINFO_TTL_S * 1000)}\n\n".encode()
+        deadline = time.monotonic() + STREAM_MAX_S
+        sent_ts = None
+        while time.monotonic() < deadline:
+            ts, compact, _ = current_snapshot()
+            # Taken after the read, so our own refresh does not wake us; one
+            # landing in between is seen on the next ping instead
+            refreshed = _snapshot_refreshed
+            if ts != sent_ts:
+                sent_ts = ts
+                yield b"data: " + compact + b"\n\n"
+            else:
+                yield b": ping\n\n"
+            due = HWINFO_TTL_S - (time.monotonic() - ts) + 0.05
+            refreshed.wait(min(STREAM_PING_S, max(0.0, due)))
+
+    response = app.response_class(events(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    # Runs when the server closes the response, including after a disconnect
+    response.call_on_close(_stream_slots.release)
+    return response
+
+
+# The index page has no template variables; it is served as prebuilt bytes,
+# gzipped once here for clients that accept it
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -281,8 +437,20 @@ def index():
     <script src="/static/app.js"></script>
 </body>
 </html>
-"""
-    )
+""".encode()
+INDEX_HTML_GZIP = gzip.compress(INDEX_HTML, mtime=0)
+
+
+@app.route("/")
+def index():
+    # Serve the main HTML page
+    if request.accept_encodings["gzip"]:
+        response = app.response_class(INDEX_HTML_GZIP, mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = app.response_class(INDEX_HTML, mimetype="text/html")
+    response.vary.add("Accept-Encoding")
+    return response
 
 
 @app.route("/static/<path:filename>")
@@ -291,6 +459,6 @@ def static_files(filename):
 
 
 if __name__ == "__main__":
-    t = threading.Thread(target=update_hwinfo, daemon=True)
-    t.start()
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    # Development server only (start.sh runs gunicorn). Debug mode, with its
+    # reloader process and debugger, is opt-in through FLASK_DEBUG=1
+    app.run(host="0.0.0.0", port=8000, threaded=True)
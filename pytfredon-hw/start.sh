@@ -3,5 +3,7 @@
 # Note: ensure gunicorn is installed in the environment (pip install gunicorn)
 # Runs the Flask `app` callable from main.py
 
-# Workers and threads kept small to reduce resource usage on low-end machines
-exec gunicorn -w 2 --threads 2 -b 0.0.0.0:8000 "main:app"
+# Workers and threads kept small to reduce resource usage on low-end machines;
+# each open page holds one thread for its /api/hwinfo/stream connection,
+# at most MAX_STREAMS (main.py) per worker so plain requests keep a thread
+exec gunicorn -w 2 --threads 4 -b 0.0.0.0:8000 "main:app"
@@ -17,7 +17,40 @@ function setLayout(newLayout) {
   }
 }
 
+// Last ?detail=1 body and its ETag; reopening a modal before the next
+// snapshot revalidates with If-None-Match and reuses it on 304
+let detailCache = null;
+
+function fetchDetail() {
+  const headers = detailCache ? { "If-None-Match": detailCache.etag } : {};
+  return fetch("/api/hwinfo?detail=1", { headers, cache: "no-store" }).then(
+    (r) => {
+      if (r.status === 304 && detailCache) return detailCache.body;
+      if (!r.ok) return null;
+      return r.json().then((body) => {
+        const etag = r.headers.get("ETag");
+        detailCache = etag ? { etag, body } : null;
+        return body;
+      });
+    },
+  );
+}
+
 function showModal(component) {
+  // The pushed summary omits sensor tables; fetch them when a modal opens
+  if (!component.withSensors) {
+    fetchDetail()
+      .then((full) => {
+        const details = full && full[component.key];
+        showModal({
+          ...component,
+          details: details || component.details,
+          withSensors: true,
+        });
+      })
+      .catch(() => showModal({ ...component, withSensors: true }));
+    return;
+  }
   const modal = document.getElementById("modal");
   const content = document.getElementById("modal-content");
   let details = component.details || {};
@@ -140,10 +173,27 @@ document.addEventListener("DOMContentLoaded", () => {
   fetchAndUpdate();
 });
 
+// How long a page refused a stream polls before asking for one again
+const STREAM_RETRY_MS = 60000;
+
 function fetchAndUpdate() {
+  // Snapshots are pushed by the server; EventSource reconnects on its own
+  // after the retry delay the stream announces
+  const source = new EventSource("/api/hwinfo/stream");
+  source.onmessage = (event) => updateStats(JSON.parse(event.data));
+  source.onerror = () => {
+    // CLOSED means the browser gave up, e.g. the server had no free stream
+    // slot and answered 204; poll for a while instead
+    if (source.readyState === EventSource.CLOSED) pollAndUpdate();
+  };
+}
+
+function pollAndUpdate() {
   // implement simple backoff
   let backoff = 10000; // start 10s
+  let stopped = false;
   function attempt() {
+    if (stopped) return;
     fetch("/api/hwinfo")
       .then((r) => {
         if (!r.ok) throw new Error("bad");
@@ -161,6 +211,12 @@ function fetchAndUpdate() {
       });
   }
   attempt();
+  // Slots free up as other pages close; stop polling and try the stream
+  // again, which lands back here if the server is still full
+  setTimeout(() => {
+    stopped = true;
+    fetchAndUpdate();
+  }, STREAM_RETRY_MS);
 }
 
 function updateStats(data) {